@@ -1,11 +1,178 @@
 import argparse
+import functools
+import io
+import os
 import sys
+from dataclasses import dataclass
+from types import ModuleType
 
-import vault.core as vault
 from vault.errors import DuplicateTitleError, NoteNotFoundError, StorageError
 
 
-def handle_add(args: argparse.Namespace) -> None:
+@dataclass(slots=True)
+class CliArgs:
+    """Parsed command line arguments passed to the command handlers.
+
+    A slotted replacement for `argparse.Namespace`: every option any command
+    accepts is a field, so attribute access is a slot read and a misspelt
+    attribute fails loudly.
+
+    Attributes:
+        command: The subcommand being run
+        title: Note title (add, view, delete)
+        content: Note content (add)
+        tags: Comma-separated tags (add)
+        term: Search term (search)
+        output_dir: Export directory (export)
+        quiet: Whether to suppress the success message (export)
+        jobs: Number of notes to write concurrently (export)
+    """
+
+    command: str
+    title: str | None = None
+    content: str | None = None
+    tags: str | None = None
+    term: str | None = None
+    output_dir: str | None = None
+    quiet: bool = False
+    jobs: int | None = None
+
+
+@functools.lru_cache(maxsize=1)
+def _vault() -> ModuleType:
+    """
+    Import the vault storage layer on first use.
+
+    Deferring this import keeps `--help` and argument errors from paying for
+    the storage layer's transitive imports. The exception classes stay a
+    top-level import because `vault.errors` has no dependencies of its own.
+
+    Returns:
+        The `vault.core` module
+    """
+    import vault.core  # noqa: PLC0415
+
+    return vault.core
+
+
+# Fixed output of the listing commands
+_LIST_HEADER = "\nNotes:\n"
+_SEARCH_HEADER = "\nMatching notes:\n"
+_TAGS_HEADER = "\nTags:\n"
+_NO_NOTES = "\nNo notes found.\n"
+_NO_MATCHES = "\nNo matching notes found.\n"
+_NO_TAGS = "\nNo tags found.\n"
+
+# Message prefix for each error type the handlers report; "{op}" is replaced
+# with the action that failed. Types without an entry are reported bare.
+_ERROR_PREFIXES: dict[type[Exception], str] = {
+    StorageError: "Failed to {op} - ",
+    ValueError: "Invalid note data - ",
+    OSError: "Failed to create output directory - ",
+}
+
+
+def _fail(error: Exception, op: str) -> None:
+    """
+    Report a failed command on stderr and exit with status 1.
+
+    Args:
+        error: The exception that caused the command to fail
+        op: Short description of the failed action, e.g. "create note"
+
+    Raises:
+        SystemExit: Always, with exit status 1
+    """
+    prefix = next(
+        (_ERROR_PREFIXES[cls] for cls in type(error).__mro__ if cls in _ERROR_PREFIXES),
+        "",
+    )
+    sys.stderr.write(f"Error: {prefix.format(op=op)}{error}\n")
+    sys.exit(1)
+
+
+def _write(text: str) -> None:
+    """
+    Write a block of output to stdout with a single encode and write.
+
+    When stdout has a binary buffer, the text is encoded once and written to
+    it directly, skipping the text layer's per-write encoding. Anything
+    already printed is flushed first so output stays in order. Writing to the
+    buffer bypasses newline translation, so on platforms whose line separator
+    is not a bare newline the text goes through the text layer instead.
+
+    Args:
+        text: The complete output to write
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or os.linesep != "\n":
+        stream.write(text)
+        return
+
+    stream.flush()
+    buffer.write(text.encode(stream.encoding or "utf-8", stream.errors or "strict"))
+
+
+def _buffer_stdout() -> None:
+    """
+    Make stdout fully block-buffered when it is not a terminal.
+
+    Redirected output (`mpkv list > notes.txt`, `mpkv list | head`) is then
+    flushed in large blocks even when PYTHONUNBUFFERED or -u asked for
+    write-through. A terminal keeps its line buffering so interactive
+    prompts appear immediately.
+    """
+    stream = sys.stdout
+    if stream.isatty() or not hasattr(stream, "reconfigure"):
+        return
+    stream.reconfigure(line_buffering=False, write_through=False)
+
+
+def _read_content() -> str:
+    """
+    Read note content from standard input, up to the first empty line.
+
+    Empty lines before the content are skipped, so only an empty line after
+    some content ends it. Piped input is read in a single call and cut at the
+    first blank line. Interactive input is read with `sys.stdin.readline`,
+    which avoids the per-line prompt handling of `input()`.
+
+    Returns:
+        The content read, without the terminating empty line
+    """
+    if not sys.stdin.isatty():
+        return sys.stdin.read().lstrip("\n").split("\n\n", 1)[0].rstrip("\n")
+
+    buffer = io.StringIO()
+    for line in iter(sys.stdin.readline, ""):
+        if line == "\n":
+            if buffer.tell():
+                break
+            continue
+        buffer.write(line)
+    return buffer.getvalue().rstrip("\n")
+
+
+def _parse_tags(tags_input: str) -> list[str] | None:
+    """
+    Split a comma-separated tag string into a list of tags.
+
+    Args:
+        tags_input: Comma-separated tags, as typed by the user
+
+    Returns:
+        The stripped, non-empty tags, or None if there are none
+
+    Examples:
+        >>> _parse_tags(" work, ideas ,,")
+        ['work', 'ideas']
+        >>> _parse_tags("")
+    """
+    return list(filter(None, map(str.strip, tags_input.split(",")))) or None
+
+
+def handle_add(args: CliArgs) -> None:
     """
     Handle the 'add' command to create a new note.
 
@@ -24,46 +191,30 @@ def handle_add(args: argparse.Namespace) -> None:
     while not title:
         title = input("Enter note title: ").strip()
         if not title:
-            print("Error: Title cannot be empty. Please try again.")
+            sys.stderr.write("Error: Title cannot be empty. Please try again.\n")
 
     # Get tags
-    tags = args.tags
-    if tags is None:
-        tags_input = input("Enter tags (comma-separated, optional): ").strip()
-        tags = [tag.strip() for tag in tags_input.split(",")] if tags_input else None
+    tags_input = args.tags
+    if tags_input is None:
+        tags_input = input("Enter tags (comma-separated, optional): ")
+    tags = _parse_tags(tags_input)
 
     # Get content
     content = args.content
     if content is None:
         print("\nEnter note content (empty line to finish):")
-        lines: list[str] = []
-        while True:
-            try:
-                line = input()
-                if not line:
-                    break
-                lines.append(line)
-            except EOFError:
-                break
-        content = "\n".join(lines)
+        content = _read_content()
 
     try:
         # Create the note
-        note = vault.create_note(title, content, tags)
+        note = _vault().create_note(title, content, tags)
         print(f"\nNote '{note.title}' created successfully!")
 
-    except ValueError as e:
-        print(f"Error: Invalid note data - {e}")
-        sys.exit(1)
-    except DuplicateTitleError as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    except StorageError as e:
-        print(f"Error: Failed to create note - {e}")
-        sys.exit(1)
+    except (ValueError, DuplicateTitleError, StorageError) as e:
+        _fail(e, "create note")
 
 
-def handle_view(args: argparse.Namespace) -> None:
+def handle_view(args: CliArgs) -> None:
     """
     Handle the 'view' command to display a note.
 
@@ -79,18 +230,14 @@ def handle_view(args: argparse.Namespace) -> None:
     """
     try:
         # Get the note
-        note = vault.get_note_by_title(args.title)
+        note = _vault().get_note_by_title(args.title)
         print(f"\n{note.content}")
 
-    except NoteNotFoundError as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    except StorageError as e:
-        print(f"Error: Failed to retrieve note - {e}")
-        sys.exit(1)
+    except (NoteNotFoundError, StorageError) as e:
+        _fail(e, "retrieve note")
 
 
-def handle_list(args: argparse.Namespace) -> None:
+def handle_list(args: CliArgs) -> None:
     """
     Handle the 'list' command to display all notes.
 
@@ -105,22 +252,19 @@ def handle_list(args: argparse.Namespace) -> None:
     """
     try:
         # Get all titles
-        titles = vault.get_all_titles()
+        titles = _vault().get_all_titles()
 
         # Display results
         if titles:
-            print("\nNotes:")
-            for title in titles:
-                print(f"- {title}")
+            _write(_LIST_HEADER + "\n".join("- " + title for title in titles) + "\n")
         else:
-            print("\nNo notes found.")
+            _write(_NO_NOTES)
 
     except StorageError as e:
-        print(f"Error: Failed to list notes - {e}")
-        sys.exit(1)
+        _fail(e, "list notes")
 
 
-def handle_search(args: argparse.Namespace) -> None:
+def handle_search(args: CliArgs) -> None:
     """
     Handle the 'search' command to find notes.
 
@@ -136,22 +280,23 @@ def handle_search(args: argparse.Namespace) -> None:
     """
     try:
         # Search for notes
-        matching_notes = vault.search_notes(args.term)
+        matching_notes = _vault().search_notes(args.term)
 
         # Display results
         if matching_notes:
-            print("\nMatching notes:")
-            for note in matching_notes:
-                print(f"- {note.title}")
+            _write(
+                _SEARCH_HEADER
+                + "\n".join("- " + note.title for note in matching_notes)
+                + "\n"
+            )
         else:
-            print("\nNo matching notes found.")
+            _write(_NO_MATCHES)
 
     except StorageError as e:
-        print(f"Error: Failed to search notes - {e}")
-        sys.exit(1)
+        _fail(e, "search notes")
 
 
-def handle_delete(args: argparse.Namespace) -> None:
+def handle_delete(args: CliArgs) -> None:
     """
     Handle the 'delete' command to remove a note.
 
@@ -166,27 +311,25 @@ def handle_delete(args: argparse.Namespace) -> None:
     """
     try:
         # Delete the note
-        vault.delete_note_by_title(args.title)
+        _vault().delete_note_by_title(args.title)
         print(f"\nNote '{args.title}' deleted successfully!")
 
-    except NoteNotFoundError as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    except StorageError as e:
-        print(f"Error: Failed to delete note - {e}")
-        sys.exit(1)
+    except (NoteNotFoundError, StorageError) as e:
+        _fail(e, "delete note")
 
 
-def handle_export(args: argparse.Namespace) -> None:
+def handle_export(args: CliArgs) -> None:
     """
     Handle the 'export' command to export notes to files.
 
     This function exports all notes from the vault to individual text files
     in the specified output directory. Each file is named after the note's
-    title and contains both the title and content.
+    title and contains both the title and content. The success message is
+    suppressed with --quiet, and --jobs writes several notes at once.
 
     Args:
-        args: Parsed command line arguments containing the output directory
+        args: Parsed command line arguments containing the output directory,
+            the quiet flag and the number of export jobs
 
     Raises:
         SystemExit: If there are storage or OS errors
@@ -196,18 +339,15 @@ def handle_export(args: argparse.Namespace) -> None:
         output_dir = args.output_dir or "mpkv_export"
 
         # Export notes
-        vault.export_notes(output_dir)
-        print(f"\nNotes exported successfully to: {output_dir}")
+        _vault().export_notes(output_dir, max_workers=args.jobs)
+        if not args.quiet:
+            _write(f"\nNotes exported successfully to: {output_dir}\n")
 
-    except OSError as e:
-        print(f"Error: Failed to create output directory - {e}")
-        sys.exit(1)
-    except StorageError as e:
-        print(f"Error: Failed to export notes - {e}")
-        sys.exit(1)
+    except (OSError, StorageError) as e:
+        _fail(e, "export notes")
 
 
-def handle_tags(args: argparse.Namespace) -> None:
+def handle_tags(args: CliArgs) -> None:
     """
     Handle the 'tags' command to display tag statistics.
 
@@ -223,82 +363,246 @@ def handle_tags(args: argparse.Namespace) -> None:
     """
     try:
         # Get tag counts
-        tag_counts = vault.get_all_tags_with_counts()
+        tag_counts = _vault().get_all_tags_with_counts()
 
         # Display results
         if tag_counts:
-            print("\nTags:")
-            for tag in sorted(tag_counts.keys()):
-                count = tag_counts[tag]
-                print(f"- {tag} ({count} note{'s' if count != 1 else ''})")
+            lines = [
+                f"- {tag} ({count} note{'' if count == 1 else 's'})"
+                for tag, count in sorted(tag_counts.items())
+            ]
+            _write(_TAGS_HEADER + "\n".join(lines) + "\n")
         else:
-            print("\nNo tags found.")
+            _write(_NO_TAGS)
 
     except StorageError as e:
-        print(f"Error: Failed to get tags - {e}")
-        sys.exit(1)
+        _fail(e, "get tags")
+
+
+# Declarative description of every subcommand, in the order shown in --help:
+# command name -> (help text, ((flags, add_argument keyword arguments), ...))
+_COMMAND_SPECS: dict[str, tuple[str, tuple[tuple[tuple[str, ...], dict], ...]]] = {
+    "add": (
+        "Add a new note",
+        (
+            (("title",), {"nargs": "?", "help": "Title of the note"}),
+            (("content",), {"nargs": "?", "help": "Content of the note"}),
+            (("--tags", "-t"), {"help": "Tags for the note (comma-separated)"}),
+        ),
+    ),
+    "view": ("View a note", ((("title",), {"help": "Title of the note to view"}),)),
+    "list": ("List all notes", ()),
+    "search": (
+        "Search notes",
+        ((("term",), {"help": "Search term to look for in notes"}),),
+    ),
+    "delete": (
+        "Delete a note",
+        ((("title",), {"help": "Title of the note to delete"}),),
+    ),
+    "export": (
+        "Export notes to text files",
+        (
+            (
+                ("--output-dir",),
+                {"help": "Directory to export notes to (default: mpkv_export)"},
+            ),
+            (
+                ("--quiet", "-q"),
+                {
+                    "action": "store_true",
+                    "help": "Do not print a message when the export succeeds",
+                },
+            ),
+            (
+                ("--jobs", "-j"),
+                {
+                    "type": int,
+                    "help": "Number of notes to write concurrently "
+                    "(default: chosen from the vault size)",
+                },
+            ),
+        ),
+    ),
+    "tags": ("List all tags and their usage counts", ()),
+}
+
+
+def _add_subparser(subparsers: argparse._SubParsersAction, command: str) -> None:
+    """
+    Register a subcommand from its entry in _COMMAND_SPECS.
 
+    Args:
+        subparsers: The subparsers action of the top-level parser
+        command: The name of the subcommand to register
+    """
+    help_text, arguments = _COMMAND_SPECS[command]
+    command_parser = subparsers.add_parser(command, help=help_text)
+    for flags, options in arguments:
+        command_parser.add_argument(*flags, **options)
 
-def main() -> None:
+
+# Handler for each command
+_DISPATCH = {
+    "add": handle_add,
+    "view": handle_view,
+    "list": handle_list,
+    "search": handle_search,
+    "delete": handle_delete,
+    "export": handle_export,
+    "tags": handle_tags,
+}
+
+
+def _plain_positionals(arguments: tuple) -> tuple[str, ...] | None:
     """
-    Main entry point for the MPKV CLI.
+    Get the argument names of a command spec whose arguments are all plain.
 
-    This function sets up the argument parser and routes commands to their
-    respective handlers.
+    Args:
+        arguments: The argument specs of a command from _COMMAND_SPECS
+
+    Returns:
+        The positional names, or None if any argument is an option or has
+        settings other than help text (nargs, action, ...)
+    """
+    if any(
+        flags[0].startswith("-") or set(options) - {"help"}
+        for flags, options in arguments
+    ):
+        return None
+    return tuple(flags[0] for flags, _ in arguments)
+
+
+# Commands whose arguments are all required positionals, mapped to the names
+# of those positionals. main() parses these without argparse.
+_FAST_COMMANDS = {
+    command: names
+    for command, (_, arguments) in _COMMAND_SPECS.items()
+    if (names := _plain_positionals(arguments)) is not None
+}
+
+
+def _parse_fast(argv: list[str]) -> CliArgs | None:
+    """
+    Parse a simple command line without building an argparse parser.
+
+    Args:
+        argv: Command line arguments, excluding the program name
+
+    Returns:
+        The parsed arguments, or None if the command line needs argparse
+        (unknown command, flags such as --help, or a wrong argument count)
+
+    Examples:
+        >>> _parse_fast(["view", "My Note"])
+        CliArgs(command='view', title='My Note', content=None, ...)
+        >>> _parse_fast(["view", "--help"])
+    """
+    if not argv or argv[0] not in _FAST_COMMANDS:
+        return None
+
+    positionals = _FAST_COMMANDS[argv[0]]
+    values = argv[1:]
+    if len(values) != len(positionals) or any(v.startswith("-") for v in values):
+        return None
+
+    return CliArgs(argv[0], **dict(zip(positionals, values)))
+
+
+def _find_command(argv: list[str]) -> str | None:
+    """
+    Find the subcommand named on the command line without parsing it.
+
+    Args:
+        argv: Command line arguments, excluding the program name
+
+    Returns:
+        The first non-flag argument, or None if top-level help was requested
+        before any command (or no command was given)
+
+    Examples:
+        >>> _find_command(["view", "My Note"])
+        'view'
+        >>> _find_command(["--help"])
+    """
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            return None
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+# How the full set of commands is shown in usage lines
+_COMMANDS_METAVAR = "{" + ",".join(_COMMAND_SPECS) + "}"
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser, memoized per command.
+
+    Repeated calls in the same interpreter (tests, embedding) reuse the
+    parser instead of rebuilding it.
+
+    Args:
+        command: The subcommand to build a subparser for, or None to build
+            every subcommand
+
+    Returns:
+        The top-level argument parser
     """
     parser = argparse.ArgumentParser(
         description="MPKV - A simple note-taking system",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
-    # Add subparsers for different commands
+    # Add subparsers for different commands. With a single subparser built,
+    # the metavar keeps every command in the usage line of top-level errors.
+    single = command in _COMMAND_SPECS
     subparsers = parser.add_subparsers(
-        dest="command", required=True, help="Command to execute"
+        dest="command",
+        required=True,
+        help="Command to execute",
+        metavar=_COMMANDS_METAVAR if single else None,
     )
 
-    # Add command
-    add_parser = subparsers.add_parser("add", help="Add a new note")
-    add_parser.add_argument("title", nargs="?", help="Title of the note")
-    add_parser.add_argument("content", nargs="?", help="Content of the note")
-    add_parser.add_argument("--tags", "-t", help="Tags for the note (comma-separated)")
-    add_parser.set_defaults(func=handle_add)
-
-    # View command
-    view_parser = subparsers.add_parser("view", help="View a note")
-    view_parser.add_argument("title", help="Title of the note to view")
-    view_parser.set_defaults(func=handle_view)
-
-    # List command
-    list_parser = subparsers.add_parser("list", help="List all notes")
-    list_parser.set_defaults(func=handle_list)
-
-    # Search command
-    search_parser = subparsers.add_parser("search", help="Search notes")
-    search_parser.add_argument("term", help="Search term to look for in notes")
-    search_parser.set_defaults(func=handle_search)
-
-    # Delete command
-    delete_parser = subparsers.add_parser("delete", help="Delete a note")
-    delete_parser.add_argument("title", help="Title of the note to delete")
-    delete_parser.set_defaults(func=handle_delete)
-
-    # Export command
-    export_parser = subparsers.add_parser("export", help="Export notes to text files")
-    export_parser.add_argument(
-        "--output-dir",
-        help="Directory to export notes to (default: mpkv_export)",
-    )
-    export_parser.set_defaults(func=handle_export)
+    commands = (command,) if single else _COMMAND_SPECS
+    for name in commands:
+        _add_subparser(subparsers, name)
 
-    # Tags command
-    tags_parser = subparsers.add_parser(
-        "tags", help="List all tags and their usage counts"
-    )
-    tags_parser.set_defaults(func=handle_tags)
+    return parser
+
+
+def main() -> None:
+    """
+    Main entry point for the MPKV CLI.
+
+    This function sets up the argument parser and routes commands to their
+    respective handlers. Commands with only positional arguments are parsed
+    directly; otherwise only the subparser for the requested command is
+    built. All subparsers are built when top-level help is requested or the
+    command is unknown, so argparse can list the available choices.
+    """
+    _buffer_stdout()
+
+    argv = sys.argv[1:]
+    if argv:
+        # Interned so the command-table lookups below match by identity
+        argv[0] = sys.intern(argv[0])
+
+    args = _parse_fast(argv)
+    if args is not None:
+        _DISPATCH[args.command](args)
+        return
+
+    command = _find_command(argv)
+    if command not in _COMMAND_SPECS:
+        command = None
 
     # Parse arguments and execute command
-    args = parser.parse_args()
-    args.func(args)
+    args = CliArgs(**vars(_build_parser(command).parse_args()))
+    _DISPATCH[args.command](args)
 
 
 if __name__ == "__main__":
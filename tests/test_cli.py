@@ -1,8 +1,15 @@
+import contextlib
 import io
+import os
+import sys
 import unittest
-from unittest.mock import patch
+from dataclasses import dataclass
+from unittest.mock import MagicMock
 
+import cli
+import vault.core
 from cli import (
+    CliArgs,
     handle_add,
     handle_delete,
     handle_export,
@@ -13,16 +20,87 @@ from cli import (
 )
 from vault.errors import DuplicateTitleError, NoteNotFoundError, StorageError
 
+# vault.core functions the handlers call, replaced once for the whole class
+_VAULT_FUNCTIONS = (
+    "create_note",
+    "get_note_by_title",
+    "get_all_titles",
+    "delete_note_by_title",
+    "search_notes",
+    "get_all_tags_with_counts",
+    "export_notes",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeNote:
+    """Stand-in for Note carrying only the attributes the handlers read."""
+
+    title: str = ""
+    content: str = ""
+
+
+# Marks an attribute _swap added rather than replaced
+_MISSING = object()
+
+# Stand-in notes built once and shared; they are immutable
+_NOTE = _FakeNote(title="Test Note", content="Test content")
+_SEARCH_NOTES = [_FakeNote(title="Test Note 1"), _FakeNote(title="Test Note 2")]
+
 
 class TestCLI(unittest.TestCase):
     """Test cases for CLI functionality."""
 
+    # Scripted interactive input, shared by the tests that prompt
+    _INPUT_TITLE = ("", "Test Note")
+    _INPUT_TAGS = "tag1,tag2"
+    _INPUT_CONTENT = "Line 1\nLine 2\n\nIgnored\n"
+
+    @classmethod
+    def setUpClass(cls):
+        """Replace the vault functions with mocks shared by every test."""
+        cls._originals = {name: getattr(vault.core, name) for name in _VAULT_FUNCTIONS}
+        cls.vault = {name: MagicMock() for name in _VAULT_FUNCTIONS}
+        for name, mock in cls.vault.items():
+            setattr(vault.core, name, mock)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Put the real vault functions back."""
+        for name, original in cls._originals.items():
+            setattr(vault.core, name, original)
+
     def setUp(self):
         """Set up test fixtures."""
-        self.args = type("Args", (), {})()
-        self.args.title = None
-        self.args.content = None
-        self.args.tags = None
+        self.args = CliArgs(command="test")
+        for mock in self.vault.values():
+            mock.reset_mock(return_value=True, side_effect=True)
+        self._restores = []
+
+    def tearDown(self):
+        """Restore every attribute replaced with _swap, newest first."""
+        for obj, attr, original in reversed(self._restores):
+            if original is _MISSING:
+                delattr(obj, attr)
+            else:
+                setattr(obj, attr, original)
+
+    def _swap(self, obj, attr, new):
+        """Replace obj.attr with new until tearDown and return new."""
+        self._restores.append((obj, attr, getattr(obj, attr, _MISSING)))
+        setattr(obj, attr, new)
+        return new
+
+    def _assert_fails(self, handler, message):
+        """Assert handler exits with status 1, message on stderr and no stdout."""
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            with self.assertRaises(SystemExit) as cm:
+                handler(self.args)
+        self.assertEqual(cm.exception.code, 1)
+        self.assertEqual(stderr.getvalue(), message)
+        self.assertEqual(stdout.getvalue(), "")
 
     def test_handle_add_with_args(self):
         """Test handle_add with all arguments provided."""
@@ -30,326 +108,450 @@ class TestCLI(unittest.TestCase):
         self.args.content = "Test content"
         self.args.tags = "tag1,tag2"
 
-        with patch("vault.core.create_note") as mock_create:
-            mock_create.return_value = type("Note", (), {"title": "Test Note"})()
-            handle_add(self.args)
-            mock_create.assert_called_once_with(
-                "Test Note", "Test content", ["tag1", "tag2"]
-            )
+        mock_create = self.vault["create_note"]
+        mock_create.return_value = _NOTE
+        handle_add(self.args)
+        self.assertEqual(mock_create.call_count, 1)
+        self.assertEqual(
+            mock_create.call_args.args, ("Test Note", "Test content", ["tag1", "tag2"])
+        )
+        self.assertEqual(mock_create.call_args.kwargs, {})
 
     def test_handle_add_interactive_title(self):
         """Test handle_add with interactive title input."""
         self.args.content = "Test content"
         self.args.tags = "tag1,tag2"
 
-        with (
-            patch("builtins.input", side_effect=["", "Test Note"]),
-            patch("vault.core.create_note") as mock_create,
-        ):
-            mock_create.return_value = type("Note", (), {"title": "Test Note"})()
-            handle_add(self.args)
-            mock_create.assert_called_once_with(
-                "Test Note", "Test content", ["tag1", "tag2"]
-            )
+        mock_create = self.vault["create_note"]
+        self._swap(cli, "input", MagicMock(side_effect=self._INPUT_TITLE))
+        mock_create.return_value = _NOTE
+        handle_add(self.args)
+        self.assertEqual(mock_create.call_count, 1)
+        self.assertEqual(
+            mock_create.call_args.args, ("Test Note", "Test content", ["tag1", "tag2"])
+        )
+        self.assertEqual(mock_create.call_args.kwargs, {})
 
     def test_handle_add_interactive_tags(self):
         """Test handle_add with interactive tags input."""
         self.args.title = "Test Note"
         self.args.content = "Test content"
 
-        with (
-            patch("builtins.input", return_value="tag1,tag2"),
-            patch("vault.core.create_note") as mock_create,
-        ):
-            mock_create.return_value = type("Note", (), {"title": "Test Note"})()
-            handle_add(self.args)
-            mock_create.assert_called_once_with(
-                "Test Note", "Test content", ["tag1", "tag2"]
-            )
+        mock_create = self.vault["create_note"]
+        self._swap(cli, "input", MagicMock(return_value=self._INPUT_TAGS))
+        mock_create.return_value = _NOTE
+        handle_add(self.args)
+        self.assertEqual(mock_create.call_count, 1)
+        self.assertEqual(
+            mock_create.call_args.args, ("Test Note", "Test content", ["tag1", "tag2"])
+        )
+        self.assertEqual(mock_create.call_args.kwargs, {})
 
     def test_handle_add_interactive_content(self):
         """Test handle_add with interactive content input."""
         self.args.title = "Test Note"
         self.args.tags = "tag1,tag2"
 
-        with (
-            patch("builtins.input", side_effect=["Line 1", "Line 2", ""]),
-            patch("vault.core.create_note") as mock_create,
-        ):
-            mock_create.return_value = type("Note", (), {"title": "Test Note"})()
-            handle_add(self.args)
-            mock_create.assert_called_once_with(
-                "Test Note", "Line 1\nLine 2", ["tag1", "tag2"]
-            )
-
-    def test_handle_add_duplicate_title(self):
-        """Test handle_add with duplicate title error."""
+        mock_create = self.vault["create_note"]
+        self._swap(sys, "stdin", io.StringIO(self._INPUT_CONTENT))
+        mock_create.return_value = _NOTE
+        handle_add(self.args)
+        self.assertEqual(mock_create.call_count, 1)
+        self.assertEqual(
+            mock_create.call_args.args,
+            ("Test Note", "Line 1\nLine 2", ["tag1", "tag2"]),
+        )
+        self.assertEqual(mock_create.call_args.kwargs, {})
+
+    def test_handle_add_interactive_content_leading_blank_lines(self):
+        """Test handle_add skips empty lines before piped content."""
         self.args.title = "Test Note"
-        self.args.content = "Test content"
-
-        with (
-            patch("vault.core.create_note") as mock_create,
-            patch("sys.exit") as mock_exit,
-        ):
-            mock_create.side_effect = DuplicateTitleError("Test Note")
-            handle_add(self.args)
-            mock_exit.assert_called_once_with(1)
+        self.args.tags = "tag1,tag2"
 
-    def test_handle_add_storage_error(self):
-        """Test handle_add with storage error."""
+        mock_create = self.vault["create_note"]
+        self._swap(sys, "stdin", io.StringIO("\n\n" + self._INPUT_CONTENT))
+        mock_create.return_value = _NOTE
+        handle_add(self.args)
+        self.assertEqual(
+            mock_create.call_args.args,
+            ("Test Note", "Line 1\nLine 2", ["tag1", "tag2"]),
+        )
+
+    def test_handle_add_terminal_content(self):
+        """Test handle_add reads terminal content line by line."""
         self.args.title = "Test Note"
-        self.args.content = "Test content"
-
-        with (
-            patch("vault.core.create_note") as mock_create,
-            patch("sys.exit") as mock_exit,
-        ):
-            mock_create.side_effect = StorageError("Test error")
-            handle_add(self.args)
-            mock_exit.assert_called_once_with(1)
+        self.args.tags = "tag1,tag2"
 
-    def test_handle_add_value_error(self):
-        """Test handle_add with value error."""
+        mock_create = self.vault["create_note"]
+        stdin = io.StringIO("\n" + self._INPUT_CONTENT)
+        stdin.isatty = lambda: True
+        self._swap(sys, "stdin", stdin)
+        mock_create.return_value = _NOTE
+        handle_add(self.args)
+        self.assertEqual(
+            mock_create.call_args.args,
+            ("Test Note", "Line 1\nLine 2", ["tag1", "tag2"]),
+        )
+        # Reading stopped at the empty line, leaving the rest unread
+        self.assertEqual(stdin.read(), "Ignored\n")
+
+    def test_handle_add_errors(self):
+        """Test handle_add exits with status 1 on each creation error."""
         self.args.title = "Test Note"
         self.args.content = "Test content"
+        self.args.tags = "tag1,tag2"
 
-        with (
-            patch("vault.core.create_note") as mock_create,
-            patch("sys.exit") as mock_exit,
+        mock_create = self.vault["create_note"]
+        for error, message in (
+            (
+                DuplicateTitleError("Test Note"),
+                "Error: A note with title 'Test Note' already exists\n",
+            ),
+            (StorageError("Test error"), "Error: Failed to create note - Test error\n"),
+            (ValueError("Invalid data"), "Error: Invalid note data - Invalid data\n"),
         ):
-            mock_create.side_effect = ValueError("Invalid data")
-            handle_add(self.args)
-            mock_exit.assert_called_once_with(1)
+            with self.subTest(error=type(error).__name__):
+                mock_create.side_effect = error
+                self._assert_fails(handle_add, message)
+
+    def _run_main(self, *argv):
+        """Run main() on argv and return its exit code, stdout and stderr."""
+        self._swap(sys, "argv", ["mpkv", *argv])
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        code = None
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                cli.main()
+            except SystemExit as e:
+                code = e.code
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_main_fast_path(self):
+        """Test main() parses plain positional commands without argparse."""
+        self._swap(cli, "_build_parser", MagicMock(side_effect=AssertionError))
+        self.vault["get_note_by_title"].return_value = _NOTE
+
+        code, stdout, stderr = self._run_main("view", "Test Note")
+
+        self.assertIsNone(code)
+        self.assertEqual(stdout, "\nTest content\n")
+        self.assertEqual(stderr, "")
+        self.assertEqual(self.vault["get_note_by_title"].call_args.args, ("Test Note",))
+
+    def test_main_flags_use_argparse(self):
+        """Test main() falls back to argparse when flags are present."""
+        build = self._swap(cli, "_build_parser", MagicMock(wraps=cli._build_parser))
+        self.vault["create_note"].return_value = _NOTE
+
+        code, stdout, stderr = self._run_main(
+            "add", "Test Note", "Test content", "--tags", "tag1,tag2"
+        )
+
+        self.assertIsNone(code)
+        self.assertEqual(build.call_args.args, ("add",))
+        self.assertEqual(stdout, "\nNote 'Test Note' created successfully!\n")
+        self.assertEqual(stderr, "")
+        self.assertEqual(
+            self.vault["create_note"].call_args.args,
+            ("Test Note", "Test content", ["tag1", "tag2"]),
+        )
+
+    def test_main_converts_to_cli_args(self):
+        """Test main() passes argparse results to handlers as typed CliArgs."""
+        handler = MagicMock()
+        self._swap(cli, "_DISPATCH", {**cli._DISPATCH, "export": handler})
+
+        code, _, _ = self._run_main("export", "--output-dir", "out", "-q", "-j", "4")
+
+        self.assertIsNone(code)
+        self.assertEqual(
+            handler.call_args.args,
+            (CliArgs(command="export", output_dir="out", quiet=True, jobs=4),),
+        )
+
+    def test_main_help(self):
+        """Test main() --help lists every command and exits with status 0."""
+        code, stdout, stderr = self._run_main("--help")
+
+        self.assertEqual(code, 0)
+        self.assertTrue(
+            stdout.startswith(
+                "usage: mpkv [-h] {add,view,list,search,delete,export,tags} ...\n"
+            )
+        )
+        for command in ("add", "view", "list", "search", "delete", "export", "tags"):
+            self.assertIn(f"    {command} ", stdout)
+        self.assertEqual(stderr, "")
+
+    def test_main_unknown_command(self):
+        """Test main() rejects an unknown command with the full usage line."""
+        code, stdout, stderr = self._run_main("bogus")
+
+        self.assertEqual(code, 2)
+        self.assertEqual(stdout, "")
+        self.assertEqual(
+            stderr,
+            "usage: mpkv [-h] {add,view,list,search,delete,export,tags} ...\n"
+            "mpkv: error: argument command: invalid choice: 'bogus' (choose from "
+            "'add', 'view', 'list', 'search', 'delete', 'export', 'tags')\n",
+        )
+
+    def test_main_missing_positional(self):
+        """Test main() reports a missing positional with the command's usage."""
+        code, stdout, stderr = self._run_main("view")
+
+        self.assertEqual(code, 2)
+        self.assertEqual(stdout, "")
+        self.assertEqual(
+            stderr,
+            "usage: mpkv view [-h] title\n"
+            "mpkv view: error: the following arguments are required: title\n",
+        )
+        self.vault["get_note_by_title"].assert_not_called()
+
+    def test_main_extra_argument(self):
+        """Test main() top-level errors still list every command in the usage."""
+        code, stdout, stderr = self._run_main("list", "extra")
+
+        self.assertEqual(code, 2)
+        self.assertEqual(stdout, "")
+        self.assertEqual(
+            stderr,
+            "usage: mpkv [-h] {add,view,list,search,delete,export,tags} ...\n"
+            "mpkv: error: unrecognized arguments: extra\n",
+        )
+        self.vault["get_all_titles"].assert_not_called()
+
+    def test_write_translates_newlines(self):
+        """Test _write keeps newline translation where the separator is not \\n."""
+        stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", newline="\r\n")
+        self._swap(sys, "stdout", stream)
+        self._swap(os, "linesep", "\r\n")
+
+        cli._write("\nNotes:\n- Note 1\n")
+
+        stream.flush()
+        self.assertEqual(stream.buffer.getvalue(), b"\r\nNotes:\r\n- Note 1\r\n")
+
+    def test_write_encodes_to_buffer(self):
+        """Test _write writes encoded bytes straight to the buffer on POSIX."""
+        stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", newline="\r\n")
+        self._swap(sys, "stdout", stream)
+        self._swap(os, "linesep", "\n")
+
+        cli._write("- Caf\u00e9\n")
+
+        self.assertEqual(stream.buffer.getvalue(), "- Caf\u00e9\n".encode())
 
     def test_handle_view_success(self):
         """Test handle_view with successful note retrieval."""
         self.args.title = "Test Note"
-        mock_note = type("Note", (), {"content": "Test content"})()
 
-        with (
-            patch("vault.core.get_note_by_title", return_value=mock_note),
-            patch("sys.stdout", new=io.StringIO()) as mock_stdout,
-        ):
+        self.vault["get_note_by_title"].return_value = _NOTE
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             handle_view(self.args)
-            self.assertEqual(mock_stdout.getvalue().strip(), "Test content")
+        self.assertEqual(stdout.getvalue(), "\nTest content\n")
 
-    def test_handle_view_not_found(self):
-        """Test handle_view with note not found error."""
+    def test_handle_view_errors(self):
+        """Test handle_view exits with status 1 on lookup errors."""
         self.args.title = "Test Note"
 
-        with (
-            patch("vault.core.get_note_by_title") as mock_get,
-            patch("sys.exit") as mock_exit,
+        mock_get = self.vault["get_note_by_title"]
+        for error, message in (
+            (NoteNotFoundError("Test Note"), "Error: Note 'Test Note' not found\n"),
+            (
+                StorageError("Test error"),
+                "Error: Failed to retrieve note - Test error\n",
+            ),
         ):
-            mock_get.side_effect = NoteNotFoundError("Test Note")
-            handle_view(self.args)
-            mock_exit.assert_called_once_with(1)
-
-    def test_handle_view_storage_error(self):
-        """Test handle_view with storage error."""
-        self.args.title = "Test Note"
-
-        with (
-            patch("vault.core.get_note_by_title") as mock_get,
-            patch("sys.exit") as mock_exit,
-        ):
-            mock_get.side_effect = StorageError("Test error")
-            handle_view(self.args)
-            mock_exit.assert_called_once_with(1)
+            with self.subTest(error=type(error).__name__):
+                mock_get.side_effect = error
+                self._assert_fails(handle_view, message)
 
     def test_handle_list_success(self):
         """Test handle_list with successful note retrieval."""
-        with (
-            patch("vault.core.get_all_titles", return_value=["Note 1", "Note 2"]),
-            patch("sys.stdout", new=io.StringIO()) as mock_stdout,
-        ):
+        self.vault["get_all_titles"].return_value = ["Note 1", "Note 2"]
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             handle_list(self.args)
-            expected_output = "\nNotes:\n- Note 1\n- Note 2"
-            self.assertEqual(mock_stdout.getvalue().strip(), expected_output.strip())
+        self.assertEqual(stdout.getvalue(), "\nNotes:\n- Note 1\n- Note 2\n")
 
     def test_handle_list_empty(self):
         """Test handle_list with no notes."""
-        with (
-            patch("vault.core.get_all_titles", return_value=[]),
-            patch("sys.stdout", new=io.StringIO()) as mock_stdout,
-        ):
+        self.vault["get_all_titles"].return_value = []
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             handle_list(self.args)
-            self.assertEqual(mock_stdout.getvalue().strip(), "No notes found.")
+        self.assertEqual(stdout.getvalue(), "\nNo notes found.\n")
 
     def test_handle_list_storage_error(self):
         """Test handle_list with storage error."""
-        with (
-            patch("vault.core.get_all_titles") as mock_get,
-            patch("sys.exit") as mock_exit,
-        ):
-            mock_get.side_effect = StorageError("Test error")
-            handle_list(self.args)
-            mock_exit.assert_called_once_with(1)
+        mock_get = self.vault["get_all_titles"]
+        mock_get.side_effect = StorageError("Test error")
+        self._assert_fails(handle_list, "Error: Failed to list notes - Test error\n")
 
     def test_handle_delete_success(self):
         """Test handle_delete with successful note deletion."""
         self.args.title = "Test Note"
 
-        with (
-            patch("vault.core.delete_note_by_title") as mock_delete,
-            patch("sys.stdout", new=io.StringIO()) as mock_stdout,
-        ):
-            handle_delete(self.args)
-            mock_delete.assert_called_once_with("Test Note")
-            self.assertEqual(
-                mock_stdout.getvalue().strip(), "Note 'Test Note' deleted successfully!"
-            )
-
-    def test_handle_delete_not_found(self):
-        """Test handle_delete with note not found error."""
-        self.args.title = "Test Note"
-
-        with (
-            patch("vault.core.delete_note_by_title") as mock_delete,
-            patch("sys.exit") as mock_exit,
-        ):
-            mock_delete.side_effect = NoteNotFoundError("Test Note")
+        mock_delete = self.vault["delete_note_by_title"]
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             handle_delete(self.args)
-            mock_exit.assert_called_once_with(1)
-
-    def test_handle_delete_storage_error(self):
-        """Test handle_delete with storage error."""
+        self.assertEqual(mock_delete.call_count, 1)
+        self.assertEqual(mock_delete.call_args.args, ("Test Note",))
+        self.assertEqual(mock_delete.call_args.kwargs, {})
+        self.assertEqual(
+            stdout.getvalue(), "\nNote 'Test Note' deleted successfully!\n"
+        )
+
+    def test_handle_delete_errors(self):
+        """Test handle_delete exits with status 1 on deletion errors."""
         self.args.title = "Test Note"
 
-        with (
-            patch("vault.core.delete_note_by_title") as mock_delete,
-            patch("sys.exit") as mock_exit,
+        mock_delete = self.vault["delete_note_by_title"]
+        for error, message in (
+            (NoteNotFoundError("Test Note"), "Error: Note 'Test Note' not found\n"),
+            (StorageError("Test error"), "Error: Failed to delete note - Test error\n"),
         ):
-            mock_delete.side_effect = StorageError("Test error")
-            handle_delete(self.args)
-            mock_exit.assert_called_once_with(1)
+            with self.subTest(error=type(error).__name__):
+                mock_delete.side_effect = error
+                self._assert_fails(handle_delete, message)
 
     def test_handle_search_success(self):
         """Test handle_search with successful matches."""
         self.args.term = "test"
-        mock_notes = [
-            type("Note", (), {"title": "Test Note 1"})(),
-            type("Note", (), {"title": "Test Note 2"})(),
-        ]
-
-        with (
-            patch("vault.core.search_notes", return_value=mock_notes),
-            patch("sys.stdout", new=io.StringIO()) as mock_stdout,
-        ):
+
+        self.vault["search_notes"].return_value = _SEARCH_NOTES
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             handle_search(self.args)
-            expected_output = "\nMatching notes:\n- Test Note 1\n- Test Note 2"
-            self.assertEqual(mock_stdout.getvalue().strip(), expected_output.strip())
+        self.assertEqual(
+            stdout.getvalue(), "\nMatching notes:\n- Test Note 1\n- Test Note 2\n"
+        )
 
     def test_handle_search_no_matches(self):
         """Test handle_search with no matching notes."""
         self.args.term = "nonexistent"
 
-        with (
-            patch("vault.core.search_notes", return_value=[]),
-            patch("sys.stdout", new=io.StringIO()) as mock_stdout,
-        ):
+        self.vault["search_notes"].return_value = []
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             handle_search(self.args)
-            self.assertEqual(mock_stdout.getvalue().strip(), "No matching notes found.")
+        self.assertEqual(stdout.getvalue(), "\nNo matching notes found.\n")
 
     def test_handle_search_storage_error(self):
         """Test handle_search with storage error."""
         self.args.term = "test"
 
-        with (
-            patch("vault.core.search_notes") as mock_search,
-            patch("sys.exit") as mock_exit,
-        ):
-            mock_search.side_effect = StorageError("Test error")
-            handle_search(self.args)
-            mock_exit.assert_called_once_with(1)
+        mock_search = self.vault["search_notes"]
+        mock_search.side_effect = StorageError("Test error")
+        self._assert_fails(
+            handle_search, "Error: Failed to search notes - Test error\n"
+        )
 
     def test_handle_tags_success(self):
         """Test handle_tags with successful tag retrieval."""
         tag_counts = {"work": 2, "personal": 1, "ideas": 3}
 
-        with (
-            patch("vault.core.get_all_tags_with_counts", return_value=tag_counts),
-            patch("sys.stdout", new=io.StringIO()) as mock_stdout,
-        ):
+        self.vault["get_all_tags_with_counts"].return_value = tag_counts
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             handle_tags(self.args)
-            expected_output = (
-                "\nTags:\n- ideas (3 notes)\n- personal (1 note)\n- work (2 notes)"
-            )
-            self.assertEqual(mock_stdout.getvalue().strip(), expected_output.strip())
+        self.assertEqual(
+            stdout.getvalue(),
+            "\nTags:\n- ideas (3 notes)\n- personal (1 note)\n- work (2 notes)\n",
+        )
 
     def test_handle_tags_no_tags(self):
         """Test handle_tags with no tags."""
-        with (
-            patch("vault.core.get_all_tags_with_counts", return_value={}),
-            patch("sys.stdout", new=io.StringIO()) as mock_stdout,
-        ):
+        self.vault["get_all_tags_with_counts"].return_value = {}
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             handle_tags(self.args)
-            self.assertEqual(mock_stdout.getvalue().strip(), "No tags found.")
+        self.assertEqual(stdout.getvalue(), "\nNo tags found.\n")
 
     def test_handle_tags_storage_error(self):
         """Test handle_tags with storage error."""
-        with (
-            patch("vault.core.get_all_tags_with_counts") as mock_get,
-            patch("sys.exit") as mock_exit,
-        ):
-            mock_get.side_effect = StorageError("Test error")
-            handle_tags(self.args)
-            mock_exit.assert_called_once_with(1)
+        mock_get = self.vault["get_all_tags_with_counts"]
+        mock_get.side_effect = StorageError("Test error")
+        self._assert_fails(handle_tags, "Error: Failed to get tags - Test error\n")
 
     def test_handle_export_success(self):
         """Test handle_export with successful export."""
         self.args.output_dir = "test_export"
 
-        with (
-            patch("vault.core.export_notes") as mock_export,
-            patch("sys.stdout", new=io.StringIO()) as mock_stdout,
-        ):
+        mock_export = self.vault["export_notes"]
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             handle_export(self.args)
-            mock_export.assert_called_once_with("test_export")
-            self.assertEqual(
-                mock_stdout.getvalue().strip(),
-                "Notes exported successfully to: test_export",
-            )
-
-    def test_handle_export_default_dir(self):
-        """Test handle_export with default output directory."""
-        self.args.output_dir = None
+        self.assertEqual(mock_export.call_count, 1)
+        self.assertEqual(mock_export.call_args.args, ("test_export",))
+        self.assertEqual(mock_export.call_args.kwargs, {"max_workers": None})
+        self.assertEqual(
+            stdout.getvalue(),
+            "\nNotes exported successfully to: test_export\n",
+        )
+
+    def test_handle_export_quiet(self):
+        """Test handle_export suppresses the success message when quiet."""
+        self.args.output_dir = "test_export"
+        self.args.quiet = True
 
-        with (
-            patch("vault.core.export_notes") as mock_export,
-            patch("sys.stdout", new=io.StringIO()) as mock_stdout,
-        ):
+        mock_export = self.vault["export_notes"]
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             handle_export(self.args)
-            mock_export.assert_called_once_with("mpkv_export")
-            self.assertEqual(
-                mock_stdout.getvalue().strip(),
-                "Notes exported successfully to: mpkv_export",
-            )
+        self.assertEqual(mock_export.call_count, 1)
+        self.assertEqual(mock_export.call_args.args, ("test_export",))
+        self.assertEqual(mock_export.call_args.kwargs, {"max_workers": None})
+        self.assertEqual(stdout.getvalue(), "")
 
-    def test_handle_export_storage_error(self):
-        """Test handle_export with storage error."""
+    def test_handle_export_jobs(self):
+        """Test handle_export passes the job count to the vault."""
         self.args.output_dir = "test_export"
+        self.args.jobs = 4
 
-        with (
-            patch("vault.core.export_notes") as mock_export,
-            patch("sys.exit") as mock_exit,
-        ):
-            mock_export.side_effect = StorageError("Test error")
+        mock_export = self.vault["export_notes"]
+        with contextlib.redirect_stdout(io.StringIO()):
             handle_export(self.args)
-            mock_exit.assert_called_once_with(1)
+        self.assertEqual(mock_export.call_count, 1)
+        self.assertEqual(mock_export.call_args.args, ("test_export",))
+        self.assertEqual(mock_export.call_args.kwargs, {"max_workers": 4})
 
-    def test_handle_export_os_error(self):
-        """Test handle_export with OSError."""
-        self.args.output_dir = "test_export"
+    def test_handle_export_default_dir(self):
+        """Test handle_export with default output directory."""
+        self.args.output_dir = None
 
-        with (
-            patch("vault.core.export_notes") as mock_export,
-            patch("sys.exit") as mock_exit,
-        ):
-            mock_export.side_effect = OSError("Permission denied")
+        mock_export = self.vault["export_notes"]
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             handle_export(self.args)
-            mock_exit.assert_called_once_with(1)
-
+        self.assertEqual(mock_export.call_count, 1)
+        self.assertEqual(mock_export.call_args.args, ("mpkv_export",))
+        self.assertEqual(mock_export.call_args.kwargs, {"max_workers": None})
+        self.assertEqual(
+            stdout.getvalue(),
+            "\nNotes exported successfully to: mpkv_export\n",
+        )
+
+    def test_handle_export_errors(self):
+        """Test handle_export exits with status 1 on storage and OS errors."""
+        self.args.output_dir = "test_export"
 
-if __name__ == "__main__":
-    unittest.main()
+        mock_export = self.vault["export_notes"]
+        for error, message in (
+            (
+                StorageError("Test error"),
+                "Error: Failed to export notes - Test error\n",
+            ),
+            (
+                OSError("Permission denied"),
+                "Error: Failed to create output directory - Permission denied\n",
+            ),
+        ):
+            with self.subTest(error=type(error).__name__):
+                mock_export.side_effect = error
+                self._assert_fails(handle_export, message)
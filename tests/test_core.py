@@ -1,10 +1,15 @@
+import builtins
+import functools
+import io
 import json
 import os
 import os.path
+import shutil
 import tempfile
+import time
 import unittest
 import uuid
-from unittest.mock import mock_open, patch
+from unittest.mock import MagicMock, mock_open, patch
 
 import vault.core as vault
 from vault.core import (
@@ -14,6 +19,8 @@ from vault.core import (
     _delete_note_internal,
     _get_note_file_path,
     _get_note_internal,
+    _invalidate_index_cache,
+    _read_notes_bulk,
     ensure_vault_dirs_exist,
     generate_note_id,
     get_all_titles,
@@ -23,41 +30,102 @@ from vault.core import (
     save_index,
     write_note_content,
 )
-from vault.errors import NoteNotFoundError, StorageError
+from vault.errors import DuplicateTitleError, NoteNotFoundError, StorageError
 from vault.models import Note
 
 
+@functools.lru_cache(maxsize=None)
+def _path_for(notes_dir: str, note_id: str) -> str:
+    """Return the expected content file path for a note in a notes directory."""
+    return os.path.join(notes_dir, f"{note_id}.txt")
+
+
+class _CapturedFile(io.BytesIO):
+    """In-memory file that records its final contents under a name on close."""
+
+    def __init__(self, sink: dict, name: str):
+        super().__init__()
+        self._sink = sink
+        self._name = name
+
+    def fileno(self):
+        """Return a placeholder descriptor for code that syncs the file."""
+        return -1
+
+    def close(self):
+        if not self.closed:
+            self._sink[self._name] = self.getvalue().decode("utf-8")
+        super().close()
+
+
+def _expanduser_in(home_dir: str):
+    """Return an os.path.expanduser stand-in that resolves "~" to home_dir."""
+
+    def expanduser(path: str) -> str:
+        return home_dir + path[1:] if path.startswith("~") else path
+
+    return expanduser
+
+
+def _fake_open(data: str) -> MagicMock:
+    """Return an open() stand-in whose file only needs to support read()."""
+    fake_file = MagicMock()
+    fake_file.__enter__.return_value = fake_file
+    fake_file.read.return_value = data
+    return MagicMock(return_value=fake_file)
+
+
+# Root for temporary directories created by these tests. Set TEST_TMPDIR to
+# choose it explicitly; otherwise tmpfs at /dev/shm is used when available.
+_ORIGINAL_TEMPDIR = tempfile.tempdir
+
+
+def setUpModule():
+    """Point tempfile at a memory-backed directory for this module's tests."""
+    tempfile.tempdir = os.environ.get("TEST_TMPDIR") or (
+        "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    )
+
+
+def tearDownModule():
+    """Restore the tempfile root used before this module ran."""
+    tempfile.tempdir = _ORIGINAL_TEMPDIR
+
+
 class TestVaultSetup(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Set up the vault layout shared by every test in the class."""
+        cls.home_dir = "/home/testuser"
+        cls.expected_vault_path = os.path.join(cls.home_dir, VAULT_DIR_NAME)
+        cls.expected_notes_path = os.path.join(
+            cls.expected_vault_path, NOTES_SUBDIR_NAME
+        )
+
     def setUp(self):
         """Set up test fixtures before each test method."""
-        self.home_dir = "/home/testuser"
-        self.expected_vault_path = os.path.join(self.home_dir, VAULT_DIR_NAME)
-        self.expected_notes_path = os.path.join(
-            self.expected_vault_path, NOTES_SUBDIR_NAME
-        )
+        vault._ENSURED_PATHS.clear()
+        expanduser_patcher = patch("os.path.expanduser", return_value=self.home_dir)
+        self.mock_expanduser = expanduser_patcher.start()
+        self.addCleanup(expanduser_patcher.stop)
 
-    @patch("os.path.expanduser")
-    def test_get_vault_path_default(self, mock_expanduser):
+    def test_get_vault_path_default(self):
         """Test get_vault_path with default (no custom path)."""
-        mock_expanduser.return_value = self.home_dir
         result = get_vault_path()
         self.assertEqual(result, self.expected_vault_path)
-        mock_expanduser.assert_called_once_with("~")
+        self.mock_expanduser.assert_called_once_with("~")
 
-    @patch("os.path.expanduser")
-    def test_get_vault_path_custom(self, mock_expanduser):
+    def test_get_vault_path_custom(self):
         """Test get_vault_path with custom path."""
         custom_path = "/custom/path"
-        mock_expanduser.return_value = custom_path
+        self.mock_expanduser.return_value = custom_path
         result = get_vault_path(custom_path)
         self.assertEqual(result, os.path.abspath(custom_path))
-        mock_expanduser.assert_called_once_with(custom_path)
+        self.mock_expanduser.assert_called_once_with(custom_path)
 
-    @patch("os.path.expanduser")
     @patch("os.makedirs")
-    def test_ensure_vault_dirs_exist_success(self, mock_makedirs, mock_expanduser):
+    def test_ensure_vault_dirs_exist_success(self, mock_makedirs):
         """Test successful creation of vault directories."""
-        mock_expanduser.return_value = self.home_dir
         result = ensure_vault_dirs_exist()
 
         # Check return values
@@ -68,14 +136,11 @@ class TestVaultSetup(unittest.TestCase):
         mock_makedirs.assert_any_call(self.expected_notes_path, exist_ok=True)
         self.assertEqual(mock_makedirs.call_count, 2)
 
-    @patch("os.path.expanduser")
     @patch("os.makedirs")
-    def test_ensure_vault_dirs_exist_with_custom_path(
-        self, mock_makedirs, mock_expanduser
-    ):
+    def test_ensure_vault_dirs_exist_with_custom_path(self, mock_makedirs):
         """Test directory creation with custom path."""
         custom_path = "/custom/path"
-        mock_expanduser.return_value = custom_path
+        self.mock_expanduser.return_value = custom_path
         expected_vault = os.path.abspath(custom_path)
         expected_notes = os.path.join(expected_vault, NOTES_SUBDIR_NAME)
 
@@ -89,11 +154,9 @@ class TestVaultSetup(unittest.TestCase):
         mock_makedirs.assert_any_call(expected_notes, exist_ok=True)
         self.assertEqual(mock_makedirs.call_count, 2)
 
-    @patch("os.path.expanduser")
     @patch("os.makedirs")
-    def test_ensure_vault_dirs_exist_oserror(self, mock_makedirs, mock_expanduser):
+    def test_ensure_vault_dirs_exist_oserror(self, mock_makedirs):
         """Test handling of OSError during directory creation."""
-        mock_expanduser.return_value = self.home_dir
         mock_makedirs.side_effect = OSError("Permission denied")
 
         with self.assertRaises(OSError) as context:
@@ -102,139 +165,337 @@ class TestVaultSetup(unittest.TestCase):
         self.assertEqual(str(context.exception), "Permission denied")
         mock_makedirs.assert_called_once_with(self.expected_vault_path, exist_ok=True)
 
+    @patch("os.makedirs")
+    def test_ensure_vault_dirs_exist_cached(self, mock_makedirs):
+        """Test that an already confirmed vault skips directory creation."""
+
+        first = ensure_vault_dirs_exist()
+        second = ensure_vault_dirs_exist()
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_makedirs.call_count, 2)
+
 
 class TestVaultIndex(unittest.TestCase):
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.home_dir = "/home/testuser"
-        self.vault_path = os.path.join(self.home_dir, VAULT_DIR_NAME)
-        self.index_path = os.path.join(self.vault_path, "index.json")
-        self.sample_index = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up the vault layout shared by every test in the class."""
+        cls.home_dir = "/home/testuser"
+        cls.vault_path = os.path.join(cls.home_dir, VAULT_DIR_NAME)
+        cls.index_path = os.path.join(cls.vault_path, "index.json")
+        # No test mutates the sample, so it and its serialized form are shared
+        cls._SAMPLE_INDEX = {
             "notes": {"note1": {"title": "Test Note", "tags": ["test", "example"]}}
         }
+        cls._SAMPLE_INDEX_JSON = json.dumps(cls._SAMPLE_INDEX, separators=(",", ":"))
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.load")
-    def test_load_index_valid(self, mock_json_load, mock_file):
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        _invalidate_index_cache()
+        home_patcher = patch(
+            "os.path.expanduser", side_effect=_expanduser_in(self.home_dir)
+        )
+        home_patcher.start()
+        self.addCleanup(home_patcher.stop)
+        patcher = patch(
+            "vault.core.ensure_vault_dirs_exist",
+            return_value=(
+                self.vault_path,
+                os.path.join(self.vault_path, NOTES_SUBDIR_NAME),
+            ),
+        )
+        self.mock_ensure_dirs = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("os.stat")
+    @patch("builtins.open")
+    def test_load_index_valid(self, mock_file, mock_stat):
         """Test loading a valid index file."""
-        mock_json_load.return_value = self.sample_index
+        mock_file.return_value = io.BytesIO(self._SAMPLE_INDEX_JSON.encode())
         result = load_index()
 
         # Verify file was opened correctly
-        mock_file.assert_called_once_with(self.index_path, "r", encoding="utf-8")
-        mock_json_load.assert_called_once()
-        self.assertEqual(result, self.sample_index)
+        mock_file.assert_called_once_with(self.index_path, "rb")
+        self.assertEqual(result, self._SAMPLE_INDEX)
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_load_index_file_not_found(self, mock_file):
+    @patch("os.stat")
+    @patch("builtins.open")
+    def test_load_index_file_not_found(self, mock_file, mock_stat):
         """Test loading when index file doesn't exist."""
         mock_file.side_effect = FileNotFoundError()
         result = load_index()
 
         # Verify empty dict is returned
         self.assertEqual(result, {})
-        mock_file.assert_called_once_with(self.index_path, "r", encoding="utf-8")
+        mock_file.assert_called_once_with(self.index_path, "rb")
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.load")
-    def test_load_index_invalid_json(self, mock_json_load, mock_file):
+    @patch("os.stat")
+    @patch("builtins.open", return_value=io.BytesIO(b"{not valid json"))
+    def test_load_index_invalid_json(self, mock_file, mock_stat):
         """Test loading an invalid JSON file."""
-        mock_json_load.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-
-        with self.assertRaises(StorageError) as context:
+        with self.assertRaisesRegex(
+            StorageError, "Invalid JSON in index file"
+        ) as context:
             load_index()
 
         # Verify StorageError was raised with correct message and original error
-        self.assertIn("Invalid JSON in index file", str(context.exception))
         self.assertIsInstance(context.exception.original_error, json.JSONDecodeError)
-        mock_file.assert_called_once_with(self.index_path, "r", encoding="utf-8")
+        mock_file.assert_called_once_with(self.index_path, "rb")
 
-    @patch("vault.core.ensure_vault_dirs_exist")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.dump")
-    def test_save_index_success(self, mock_json_dump, mock_file, mock_ensure_dirs):
+    def test_load_index_cache(self):
+        """Test load_index reuses the parsed index until the file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_index(self._SAMPLE_INDEX, temp_dir)
+            with patch("builtins.open") as mock_file:
+                self.assertEqual(load_index(temp_dir), self._SAMPLE_INDEX)
+            mock_file.assert_not_called()
+
+            # A rewrite by another process changes the size and is picked up
+            with open(os.path.join(temp_dir, "index.json"), "w") as f:
+                json.dump({"notes": {}}, f)
+            self.assertEqual(load_index(temp_dir), {"notes": {}})
+
+    def test_load_index_returns_copies(self):
+        """Test changes to saved or loaded indexes never reach the cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index_data = {"notes": {"a": {"title": "A", "tags": []}}}
+            save_index(index_data, temp_dir)
+            index_data["notes"]["a"]["tags"].append("changed")
+            loaded = load_index(temp_dir)
+            self.assertEqual(loaded["notes"]["a"]["tags"], [])
+
+            # A change followed by a failed save leaves the cached index as saved
+            loaded["notes"]["ghost"] = {"title": "Ghost", "tags": []}
+            with patch("os.replace", side_effect=OSError("Disk full")):
+                with self.assertRaises(StorageError):
+                    save_index(loaded, temp_dir)
+
+            self.assertEqual(get_all_titles(temp_dir), ["A"])
+
+    def test_load_index_no_cache_env(self):
+        """Test MPKV_NO_CACHE makes load_index parse the file on every call."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict(os.environ, {vault.NO_CACHE_ENV_VAR: "1"}):
+                save_index(self._SAMPLE_INDEX, temp_dir)
+                first = load_index(temp_dir)
+                second = load_index(temp_dir)
+
+        self.assertEqual(first, self._SAMPLE_INDEX)
+        self.assertIsNot(first, self._SAMPLE_INDEX)
+        self.assertIsNot(first, second)
+        self.assertEqual(vault._INDEX_CACHE, {})
+
+    def test_load_index_interns_tags(self):
+        """Test load_index shares one string per distinct tag across notes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "index.json"), "w") as f:
+                json.dump(
+                    {
+                        "notes": {
+                            "note1": {"title": "One", "tags": ["work", "home"]},
+                            "note2": {"title": "Two", "tags": ["work"]},
+                        }
+                    },
+                    f,
+                )
+
+            notes = load_index(temp_dir)["notes"]
+
+        self.assertEqual(notes["note1"]["tags"], ["work", "home"])
+        self.assertIs(notes["note1"]["tags"][0], notes["note2"]["tags"][0])
+
+    @patch("tempfile.mkstemp")
+    @patch("builtins.open")
+    @patch("os.fsync")
+    @patch("os.replace")
+    def test_save_index_success(
+        self, mock_replace, mock_fsync, mock_file, mock_mkstemp
+    ):
         """Test successful index save."""
         # Setup mocks
-        mock_ensure_dirs.return_value = (
-            self.vault_path,
-            os.path.join(self.vault_path, NOTES_SUBDIR_NAME),
-        )
+        written = {}
+        tmp_path = f"{self.index_path}.abc123.tmp"
+        mock_mkstemp.return_value = (7, tmp_path)
+        mock_file.return_value = _CapturedFile(written, "index")
 
         # Call save_index
-        save_index(self.sample_index)
+        with patch("vault.core._fsync_dir") as mock_fsync_dir, patch(
+            "os.fstat"
+        ) as mock_fstat:
+            save_index(self._SAMPLE_INDEX)
 
         # Verify ensure_vault_dirs_exist was called
-        mock_ensure_dirs.assert_called_once()
+        self.mock_ensure_dirs.assert_called_once()
 
-        # Verify file was opened correctly
-        mock_file.assert_called_once_with(self.index_path, "w", encoding="utf-8")
+        # Verify a unique temporary file was written, synced and moved into place
+        mock_mkstemp.assert_called_once_with(
+            prefix="index.json.", suffix=".tmp", dir=self.vault_path
+        )
+        mock_file.assert_called_once_with(7, "wb")
+        mock_fsync.assert_called_once()
+        mock_fstat.assert_called_once()
+        mock_replace.assert_called_once_with(tmp_path, self.index_path)
+        mock_fsync_dir.assert_called_once_with(self.vault_path)
 
-        # Verify json.dump was called with correct arguments
-        mock_json_dump.assert_called_once_with(self.sample_index, mock_file(), indent=4)
+        # Verify the index was written as compact JSON
+        self.assertEqual(written["index"], self._SAMPLE_INDEX_JSON)
 
-    @patch("vault.core.ensure_vault_dirs_exist")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_save_index_oserror(self, mock_file, mock_ensure_dirs):
+    @patch("os.remove")
+    @patch("tempfile.mkstemp")
+    @patch("builtins.open")
+    @patch("os.replace")
+    def test_save_index_oserror(
+        self, mock_replace, mock_file, mock_mkstemp, mock_remove
+    ):
         """Test handling of OSError during index save."""
         # Setup mocks
-        mock_ensure_dirs.return_value = (
-            self.vault_path,
-            os.path.join(self.vault_path, NOTES_SUBDIR_NAME),
-        )
+        tmp_path = f"{self.index_path}.abc123.tmp"
+        mock_mkstemp.return_value = (7, tmp_path)
         mock_file.side_effect = OSError("Permission denied")
 
-        with self.assertRaises(StorageError) as context:
-            save_index(self.sample_index)
+        with self.assertRaisesRegex(StorageError, "Failed to save index") as context:
+            save_index(self._SAMPLE_INDEX)
 
         # Verify StorageError was raised with correct message and original error
-        self.assertIn("Failed to save index", str(context.exception))
         self.assertIsInstance(context.exception.original_error, OSError)
 
         # Verify ensure_vault_dirs_exist was called
-        mock_ensure_dirs.assert_called_once()
+        self.mock_ensure_dirs.assert_called_once()
 
-        # Verify file open was attempted
-        mock_file.assert_called_once_with(self.index_path, "w", encoding="utf-8")
+        # Verify file open was attempted, the index left untouched and the
+        # temporary file removed
+        mock_file.assert_called_once_with(7, "wb")
+        mock_replace.assert_not_called()
+        mock_remove.assert_called_once_with(tmp_path)
 
-    @patch("vault.core.ensure_vault_dirs_exist")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.dump")
+    def test_atomic_write_concurrent_writers(self):
+        """Test threads writing one file never share or leave a temporary file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "index.json")
+            payloads = [bytes([65 + i]) * 1_000_000 for i in range(8)]
+            with vault.ThreadPoolExecutor(max_workers=8) as executor:
+                for future in [
+                    executor.submit(vault._atomic_write, path, payload)
+                    for payload in payloads * 8
+                ]:
+                    future.result()
+
+            with open(path, "rb") as f:
+                self.assertIn(f.read(), payloads)
+            self.assertEqual(os.listdir(temp_dir), ["index.json"])
+
+    def test_load_index_same_size_rewrite(self):
+        """Test a rewrite with the same size and mtime is still read afresh."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index_path = os.path.join(temp_dir, "index.json")
+            save_index({"notes": {"a": {"title": "A"}}}, temp_dir)
+            load_index(temp_dir)
+            stat = os.stat(index_path)
+
+            other_path = os.path.join(temp_dir, "other.json")
+            with open(other_path, "w") as f:
+                json.dump({"notes": {"b": {"title": "B"}}}, f, separators=(",", ":"))
+            os.utime(other_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(os.stat(other_path).st_size, stat.st_size)
+            os.replace(other_path, index_path)
+
+            self.assertEqual(load_index(temp_dir), {"notes": {"b": {"title": "B"}}})
+
+    def test_save_index_caches_own_file_only(self):
+        """Test a file replaced right after a save is not cached as the saved data."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index_path = os.path.join(temp_dir, "index.json")
+            other = {"notes": {"b": {"title": "Other writer"}}}
+
+            def other_writer(directory):
+                other_path = os.path.join(directory, "other.json")
+                with open(other_path, "w") as f:
+                    json.dump(other, f)
+                os.replace(other_path, index_path)
+
+            with patch("vault.core._fsync_dir", side_effect=other_writer):
+                save_index(self._SAMPLE_INDEX, temp_dir)
+
+            self.assertEqual(load_index(temp_dir), other)
+
+    def test_save_index_failed_replace_keeps_old_index(self):
+        """Test a save that fails to rename leaves the old index and no temp file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_index(self._SAMPLE_INDEX, temp_dir)
+
+            with patch("os.replace", side_effect=OSError("Disk full")):
+                with self.assertRaisesRegex(StorageError, "Failed to save index"):
+                    save_index({"notes": {}}, temp_dir)
+
+            self.assertEqual(os.listdir(temp_dir), ["index.json"])
+            _invalidate_index_cache()
+            self.assertEqual(load_index(temp_dir), self._SAMPLE_INDEX)
+
+    @patch("tempfile.mkstemp")
+    @patch("builtins.open")
+    @patch("os.fsync")
+    @patch("os.replace")
     def test_save_index_with_custom_path(
-        self, mock_json_dump, mock_file, mock_ensure_dirs
+        self, mock_replace, mock_fsync, mock_file, mock_mkstemp
     ):
         """Test saving index with custom vault path."""
         custom_path = "/custom/path"
         expected_vault = os.path.abspath(custom_path)
         expected_index = os.path.join(expected_vault, "index.json")
+        tmp_index = f"{expected_index}.abc123.tmp"
 
         # Setup mocks
-        mock_ensure_dirs.return_value = (
+        written = {}
+        mock_mkstemp.return_value = (7, tmp_index)
+        mock_file.return_value = _CapturedFile(written, "index")
+        self.mock_ensure_dirs.return_value = (
             expected_vault,
             os.path.join(expected_vault, NOTES_SUBDIR_NAME),
         )
 
         # Call save_index with custom path
-        save_index(self.sample_index, custom_path)
+        with patch("vault.core._fsync_dir") as mock_fsync_dir, patch("os.fstat"):
+            save_index(self._SAMPLE_INDEX, custom_path)
 
         # Verify ensure_vault_dirs_exist was called with custom path
-        mock_ensure_dirs.assert_called_once_with(custom_path)
+        self.mock_ensure_dirs.assert_called_once_with(custom_path)
 
-        # Verify file was opened with correct path
-        mock_file.assert_called_once_with(expected_index, "w", encoding="utf-8")
+        # Verify file was written next to the index and moved into place
+        mock_mkstemp.assert_called_once_with(
+            prefix="index.json.", suffix=".tmp", dir=expected_vault
+        )
+        mock_file.assert_called_once_with(7, "wb")
+        mock_replace.assert_called_once_with(tmp_index, expected_index)
+        mock_fsync_dir.assert_called_once_with(expected_vault)
 
-        # Verify json.dump was called with correct arguments
-        mock_json_dump.assert_called_once_with(self.sample_index, mock_file(), indent=4)
+        # Verify the index was written as compact JSON
+        self.assertEqual(written["index"], self._SAMPLE_INDEX_JSON)
 
 
 class TestVaultFiles(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Set up the vault layout shared by every test in the class."""
+        cls.home_dir = "/home/testuser"
+        cls.vault_path = os.path.join(cls.home_dir, VAULT_DIR_NAME)
+        cls.notes_dir = os.path.join(cls.vault_path, NOTES_SUBDIR_NAME)
+        cls.note_id = "123e4567-e89b-12d3-a456-426614174000"
+        cls.note_content = "This is a test note content"
+        cls.expected_note_path = _path_for(cls.notes_dir, cls.note_id)
+
     def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.home_dir = "/home/testuser"
-        self.vault_path = os.path.join(self.home_dir, VAULT_DIR_NAME)
-        self.notes_dir = os.path.join(self.vault_path, NOTES_SUBDIR_NAME)
-        self.note_id = "123e4567-e89b-12d3-a456-426614174000"
-        self.note_content = "This is a test note content"
-        self.expected_note_path = os.path.join(self.notes_dir, f"{self.note_id}.txt")
+        """Patch the home directory and directory creation for the vault layout."""
+        home_patcher = patch(
+            "os.path.expanduser", side_effect=_expanduser_in(self.home_dir)
+        )
+        home_patcher.start()
+        self.addCleanup(home_patcher.stop)
+        patcher = patch(
+            "vault.core.ensure_vault_dirs_exist",
+            return_value=(self.vault_path, self.notes_dir),
+        )
+        self.mock_ensure_dirs = patcher.start()
+        self.addCleanup(patcher.stop)
 
     @patch("uuid.uuid4")
     def test_generate_note_id(self, mock_uuid4):
@@ -270,7 +531,7 @@ class TestVaultFiles(unittest.TestCase):
         custom_path = "/custom/path"
         expected_vault = os.path.abspath(custom_path)
         expected_notes = os.path.join(expected_vault, NOTES_SUBDIR_NAME)
-        expected_note_path = os.path.join(expected_notes, f"{self.note_id}.txt")
+        expected_note_path = _path_for(expected_notes, self.note_id)
         mock_get_subdirs.return_value = (expected_vault, expected_notes)
 
         # Get path with custom path
@@ -280,16 +541,14 @@ class TestVaultFiles(unittest.TestCase):
         self.assertEqual(result, expected_note_path)
         mock_get_subdirs.assert_called_once_with(custom_path)
 
-    @patch("builtins.open", new_callable=mock_open, read_data="Test content")
+    @patch("builtins.open", new_callable=lambda: _fake_open("Test content"))
     def test_read_note_content_success(self, mock_file):
         """Test successful note content reading."""
         result = read_note_content(self.note_id)
 
         # Verify result
         self.assertEqual(result, "Test content")
-        mock_file.assert_called_once_with(
-            self.expected_note_path, "r", encoding="utf-8"
-        )
+        mock_file.assert_called_once_with(self.expected_note_path, encoding="utf-8")
 
     @patch("builtins.open", new_callable=mock_open)
     def test_read_note_content_not_found(self, mock_file):
@@ -301,92 +560,119 @@ class TestVaultFiles(unittest.TestCase):
 
         # Verify error
         self.assertEqual(context.exception.note_id, self.note_id)
-        mock_file.assert_called_once_with(
-            self.expected_note_path, "r", encoding="utf-8"
-        )
+        mock_file.assert_called_once_with(self.expected_note_path, encoding="utf-8")
 
     @patch("builtins.open", new_callable=mock_open)
     def test_read_note_content_oserror(self, mock_file):
         """Test handling of OSError during note reading."""
         mock_file.side_effect = OSError("Permission denied")
 
-        with self.assertRaises(StorageError) as context:
+        with self.assertRaisesRegex(
+            StorageError, "Failed to read note content"
+        ) as context:
             read_note_content(self.note_id)
 
         # Verify error
-        self.assertIn("Failed to read note content", str(context.exception))
         self.assertIsInstance(context.exception.original_error, OSError)
-        mock_file.assert_called_once_with(
-            self.expected_note_path, "r", encoding="utf-8"
-        )
+        mock_file.assert_called_once_with(self.expected_note_path, encoding="utf-8")
+
+    def test_read_notes_bulk(self):
+        """Test bulk note reading skips notes without a content file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            notes_dir = os.path.join(temp_dir, NOTES_SUBDIR_NAME)
+            os.makedirs(notes_dir)
+            for note_id, content in (("a", "Content A"), ("b", "Content B")):
+                with open(os.path.join(notes_dir, f"{note_id}.txt"), "w") as f:
+                    f.write(content)
+
+            result = _read_notes_bulk(["a", "missing", "b"], temp_dir)
+
+        self.assertEqual(result, {"a": "Content A", "b": "Content B"})
+
+    @patch("vault.core.PARALLEL_READ_THRESHOLD", 2)
+    @patch("vault.core.ThreadPoolExecutor", wraps=vault.ThreadPoolExecutor)
+    def test_read_notes_bulk_parallel_above_threshold(self, mock_executor):
+        """Test bulk note reading uses a thread pool for large batches."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            notes_dir = os.path.join(temp_dir, NOTES_SUBDIR_NAME)
+            os.makedirs(notes_dir)
+            for note_id, content in (("a", "Content A"), ("b", "Content B")):
+                with open(os.path.join(notes_dir, f"{note_id}.txt"), "w") as f:
+                    f.write(content)
+
+            result = _read_notes_bulk(["a", "missing", "b"], temp_dir)
+
+        mock_executor.assert_called_once()
+        self.assertEqual(result, {"a": "Content A", "b": "Content B"})
 
-    @patch("vault.core.ensure_vault_dirs_exist")
     @patch("builtins.open", new_callable=mock_open)
-    def test_write_note_content_success(self, mock_file, mock_ensure_dirs):
+    def test_write_note_content_success(self, mock_file):
         """Test successful note content writing."""
-        # Setup mock
-        mock_ensure_dirs.return_value = (self.vault_path, self.notes_dir)
-
         # Write content
         write_note_content(self.note_id, self.note_content)
 
         # Verify ensure_vault_dirs_exist was called
-        mock_ensure_dirs.assert_called_once()
+        self.mock_ensure_dirs.assert_called_once()
 
         # Verify file was opened and written correctly
-        mock_file.assert_called_once_with(
-            self.expected_note_path, "w", encoding="utf-8"
-        )
-        mock_file().write.assert_called_once_with(self.note_content)
+        mock_file.assert_called_once_with(self.expected_note_path, "wb")
+        mock_file().write.assert_called_once_with(self.note_content.encode("utf-8"))
 
-    @patch("vault.core.ensure_vault_dirs_exist")
+    @patch("os.fsync")
     @patch("builtins.open", new_callable=mock_open)
-    def test_write_note_content_oserror(self, mock_file, mock_ensure_dirs):
+    def test_write_note_content_fsync(self, mock_file, mock_fsync):
+        """Test note content is flushed to disk when fsync is requested."""
+
+        write_note_content(self.note_id, self.note_content, fsync=True)
+
+        mock_file().flush.assert_called_once()
+        mock_fsync.assert_called_once_with(mock_file().fileno())
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_write_note_content_oserror(self, mock_file):
         """Test handling of OSError during note writing."""
         # Setup mocks
-        mock_ensure_dirs.return_value = (self.vault_path, self.notes_dir)
         mock_file.side_effect = OSError("Permission denied")
 
-        with self.assertRaises(StorageError) as context:
+        with self.assertRaisesRegex(
+            StorageError, "Failed to write note content"
+        ) as context:
             write_note_content(self.note_id, self.note_content)
 
         # Verify error
-        self.assertIn("Failed to write note content", str(context.exception))
         self.assertIsInstance(context.exception.original_error, OSError)
 
         # Verify ensure_vault_dirs_exist was called
-        mock_ensure_dirs.assert_called_once()
+        self.mock_ensure_dirs.assert_called_once()
 
         # Verify file open was attempted
-        mock_file.assert_called_once_with(
-            self.expected_note_path, "w", encoding="utf-8"
-        )
+        mock_file.assert_called_once_with(self.expected_note_path, "wb")
 
-    @patch("vault.core.ensure_vault_dirs_exist")
     @patch("builtins.open", new_callable=mock_open)
-    def test_write_note_content_with_custom_path(self, mock_file, mock_ensure_dirs):
+    def test_write_note_content_with_custom_path(self, mock_file):
         """Test writing note content with custom vault path."""
         # Setup
         custom_path = "/custom/path"
         expected_vault = os.path.abspath(custom_path)
         expected_notes = os.path.join(expected_vault, NOTES_SUBDIR_NAME)
-        expected_note_path = os.path.join(expected_notes, f"{self.note_id}.txt")
-        mock_ensure_dirs.return_value = (expected_vault, expected_notes)
+        expected_note_path = _path_for(expected_notes, self.note_id)
+        self.mock_ensure_dirs.return_value = (expected_vault, expected_notes)
 
         # Write content with custom path
         write_note_content(self.note_id, self.note_content, custom_path)
 
         # Verify ensure_vault_dirs_exist was called with custom path
-        mock_ensure_dirs.assert_called_once_with(custom_path)
+        self.mock_ensure_dirs.assert_called_once_with(custom_path)
 
         # Verify file was opened and written correctly
-        mock_file.assert_called_once_with(expected_note_path, "w", encoding="utf-8")
-        mock_file().write.assert_called_once_with(self.note_content)
+        mock_file.assert_called_once_with(expected_note_path, "wb")
+        mock_file().write.assert_called_once_with(self.note_content.encode("utf-8"))
 
 
 class TestVaultPersistence(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures before each test method."""
+        _invalidate_index_cache()
         self.home_dir = "/home/testuser"
         self.vault_path = os.path.join(self.home_dir, VAULT_DIR_NAME)
         self.notes_dir = os.path.join(self.vault_path, NOTES_SUBDIR_NAME)
@@ -413,6 +699,36 @@ class TestVaultPersistence(unittest.TestCase):
             }
         }
 
+    def _bootstrap_notes(self, notes) -> list:
+        """Create notes in a temporary default vault with a single index write.
+
+        Each entry is a ``(title, content)`` or ``(title, content, tags)``
+        tuple. The index entries come from Note.to_dict, so they carry every
+        field search needs, and the index is loaded and saved once.
+        """
+        vault_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, vault_path, ignore_errors=True)
+        real_get_vault_path = vault.get_vault_path
+        patcher = patch(
+            "vault.core.get_vault_path",
+            side_effect=lambda custom_path=None: real_get_vault_path(
+                custom_path or vault_path
+            ),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        index_data = load_index()
+        index_notes = dict(index_data.get("notes", {}))
+        note_ids = []
+        for title, content, *rest in notes:
+            note = Note(title=title, content=content, tags=rest[0] if rest else None)
+            index_notes[note.id] = note.to_dict()
+            write_note_content(note.id, content)
+            note_ids.append(note.id)
+        save_index({**index_data, "notes": index_notes})
+        return note_ids
+
     @patch("vault.core.write_note_content")
     @patch("vault.core.load_index")
     @patch("vault.core.save_index")
@@ -438,6 +754,67 @@ class TestVaultPersistence(unittest.TestCase):
         self.assertIn(self.note.id, saved_index["notes"])
         self.assertEqual(saved_index["notes"][self.note.id]["title"], self.note_title)
 
+    def test_create_note_after_vault_removed(self):
+        """Test a vault deleted while the process runs is recreated on write."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vault_dir = os.path.join(temp_dir, "vault")
+            vault.create_note("First", "apples and pears", vault_path=vault_dir)
+            shutil.rmtree(vault_dir)
+
+            second = vault.create_note("Second", "bananas only", vault_path=vault_dir)
+
+            self.assertEqual(get_all_titles(vault_dir), ["Second"])
+            self.assertEqual(read_note_content(second.id, vault_dir), "bananas only")
+
+    def test_title_to_id_maintained(self):
+        """Test create and delete keep the persisted title-to-ID mapping current."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = vault.create_note("First", "apples and pears", vault_path=temp_dir)
+            second = vault.create_note("Second", "bananas only", vault_path=temp_dir)
+            self.assertEqual(
+                load_index(temp_dir)["title_to_id"],
+                {"First": first.id, "Second": second.id},
+            )
+
+            _delete_note_internal(first.id, temp_dir)
+            self.assertEqual(load_index(temp_dir)["title_to_id"], {"Second": second.id})
+            self.assertIsNone(vault._find_note_id_by_title("First", temp_dir))
+            self.assertEqual(
+                vault._find_note_id_by_title("Second", temp_dir), second.id
+            )
+
+    @patch("vault.core.load_index")
+    def test_find_note_id_by_title_without_mapping(self, mock_load_index):
+        """Test title lookups rebuild the mapping for indexes written without it."""
+        mock_load_index.return_value = self.index_data
+
+        self.assertEqual(vault._find_note_id_by_title(self.note_title), self.note_id)
+        self.assertIsNone(vault._find_note_id_by_title("Missing"))
+
+    @patch("vault.core.load_index")
+    def test_find_note_id_by_title_stale_mapping(self, mock_load_index):
+        """Test title lookups see past a mapping whose size matches but is stale."""
+        mock_load_index.return_value = {
+            "notes": {"n1": {"title": "Renamed"}, "n2": {"title": "Original"}},
+            "title_to_id": {"Original": "n1", "Other": "n2"},
+        }
+
+        self.assertEqual(vault._find_note_id_by_title("Original"), "n2")
+        self.assertEqual(vault._find_note_id_by_title("Renamed"), "n1")
+        self.assertIsNone(vault._find_note_id_by_title("Other"))
+
+    def test_create_notes_bulk_duplicate_title_stale_mapping(self):
+        """Test the duplicate check finds a renamed note missing from the mapping."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            note = vault.create_note("Original", "Some content", vault_path=temp_dir)
+            index_data = load_index(temp_dir)
+            index_data["notes"][note.id]["title"] = "Renamed"
+            save_index(index_data, temp_dir)
+
+            with self.assertRaises(DuplicateTitleError):
+                vault.create_notes_bulk([("Renamed", "Other content", None)], temp_dir)
+            self.assertEqual(vault.get_note_by_title("Renamed", temp_dir).id, note.id)
+
     @patch("vault.core.write_note_content")
     @patch("vault.core.load_index")
     def test_create_note_storage_error(self, mock_load_index, mock_write_content):
@@ -445,11 +822,10 @@ class TestVaultPersistence(unittest.TestCase):
         # Setup mocks
         mock_write_content.side_effect = StorageError("Write failed")
 
-        with self.assertRaises(StorageError) as context:
+        with self.assertRaisesRegex(StorageError, "Failed to create note") as context:
             _create_note_internal(self.note)
 
         # Verify error
-        self.assertIn("Failed to create note", str(context.exception))
         self.assertIsInstance(context.exception.original_error, StorageError)
         mock_write_content.assert_called_once()
         mock_load_index.assert_not_called()
@@ -497,18 +873,18 @@ class TestVaultPersistence(unittest.TestCase):
         mock_load_index.return_value = self.index_data
         mock_read_content.side_effect = StorageError("Read failed")
 
-        with self.assertRaises(StorageError) as context:
+        with self.assertRaisesRegex(StorageError, "Failed to get note") as context:
             _get_note_internal(self.note_id)
 
         # Verify error
-        self.assertIn("Failed to get note", str(context.exception))
         self.assertIsInstance(context.exception.original_error, StorageError)
         mock_load_index.assert_called_once()
         mock_read_content.assert_called_once()
 
+    @patch("vault.core.save_index")
     @patch("vault.core.load_index")
     @patch("os.remove")
-    def test_delete_note_success(self, mock_remove, mock_load_index):
+    def test_delete_note_success(self, mock_remove, mock_load_index, mock_save_index):
         """Test successful note deletion."""
         # Setup mocks
         mock_load_index.return_value = self.index_data
@@ -521,6 +897,8 @@ class TestVaultPersistence(unittest.TestCase):
 
         # Verify index operations
         mock_load_index.assert_called_once()
+        mock_save_index.assert_called_once()
+        self.assertNotIn(self.note_id, mock_save_index.call_args[0][0]["notes"])
 
     @patch("vault.core.load_index")
     def test_delete_note_not_found(self, mock_load_index):
@@ -535,9 +913,12 @@ class TestVaultPersistence(unittest.TestCase):
         self.assertEqual(context.exception.note_id, self.note_id)
         mock_load_index.assert_called_once()
 
+    @patch("vault.core.save_index")
     @patch("vault.core.load_index")
     @patch("os.remove")
-    def test_delete_note_file_not_found(self, mock_remove, mock_load_index):
+    def test_delete_note_file_not_found(
+        self, mock_remove, mock_load_index, mock_save_index
+    ):
         """Test handling of missing note file during deletion."""
         # Setup mocks
         mock_load_index.return_value = self.index_data
@@ -546,8 +927,9 @@ class TestVaultPersistence(unittest.TestCase):
         # Delete note (should not raise error)
         _delete_note_internal(self.note_id)
 
-        # Verify file removal was attempted
+        # Verify file removal was attempted and the note was still dropped
         mock_remove.assert_called_once()
+        mock_save_index.assert_called_once()
 
     @patch("vault.core.load_index")
     @patch("os.remove")
@@ -557,15 +939,112 @@ class TestVaultPersistence(unittest.TestCase):
         mock_load_index.return_value = self.index_data
         mock_remove.side_effect = OSError("Permission denied")
 
-        with self.assertRaises(StorageError) as context:
+        with self.assertRaisesRegex(
+            StorageError, "Failed to remove note file"
+        ) as context:
             _delete_note_internal(self.note_id)
 
         # Verify error
-        self.assertIn("Failed to remove note file", str(context.exception))
         self.assertIsInstance(context.exception.original_error, OSError)
         mock_load_index.assert_called_once()
         mock_remove.assert_called_once()
 
+    def test_create_notes_bulk(self):
+        """Test bulk creation saves the index once and makes notes searchable."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("vault.core.save_index", wraps=vault.save_index) as mock_save:
+                notes = vault.create_notes_bulk(
+                    [
+                        ("First", "apples and pears", "fruit, green"),
+                        ("Second", "bananas only here", None),
+                    ],
+                    temp_dir,
+                )
+
+            mock_save.assert_called_once()
+            self.assertEqual([note.title for note in notes], ["First", "Second"])
+            self.assertEqual(notes[0].tags, ["fruit", "green"])
+            self.assertEqual(vault.get_all_titles(temp_dir), ["First", "Second"])
+            self.assertEqual(
+                vault._find_note_id_by_title("Second", temp_dir), notes[1].id
+            )
+            results = vault.search_notes("banana", temp_dir)
+            self.assertEqual([note.id for note in results], [notes[1].id])
+
+    def test_create_notes_bulk_duplicate_title(self):
+        """Test bulk creation rejects duplicate titles before writing anything."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vault.create_note("First", "apples and pears", vault_path=temp_dir)
+            batches = (
+                [("Second", "bananas only here", None), ("First", "again", None)],
+                [("Second", "bananas only here", None), ("Second", "twice", None)],
+            )
+            for batch in batches:
+                with self.subTest(batch=batch):
+                    with self.assertRaises(DuplicateTitleError):
+                        vault.create_notes_bulk(batch, temp_dir)
+
+            self.assertEqual(vault.get_all_titles(temp_dir), ["First"])
+            self.assertEqual(
+                len(os.listdir(os.path.join(temp_dir, NOTES_SUBDIR_NAME))), 1
+            )
+
+    def test_create_notes_bulk_write_error(self):
+        """Test a failed content write removes the batch's files and keeps the index."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vault.ensure_vault_dirs_exist(temp_dir)
+            real_write = vault.write_note_content
+            calls = []
+
+            def failing_write(note_id, content, vault_path=None):
+                calls.append(note_id)
+                if len(calls) == 2:
+                    raise StorageError("Disk full")
+                real_write(note_id, content, vault_path)
+
+            with patch("vault.core.write_note_content", side_effect=failing_write):
+                with self.assertRaisesRegex(StorageError, "Failed to create notes"):
+                    vault.create_notes_bulk(
+                        [
+                            ("First", "apples and pears", None),
+                            ("Second", "bananas only here", None),
+                        ],
+                        temp_dir,
+                    )
+
+            self.assertEqual(os.listdir(os.path.join(temp_dir, NOTES_SUBDIR_NAME)), [])
+            self.assertEqual(load_index(temp_dir), {})
+
+    def test_delete_notes_bulk(self):
+        """Test bulk deletion saves the index once and skips deleted notes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = vault.create_note("First", "apples and pears", vault_path=temp_dir)
+            second = vault.create_note(
+                "Second", "bananas only here", vault_path=temp_dir
+            )
+            vault.create_note("Third", "cherries and pears", vault_path=temp_dir)
+
+            with patch("vault.core.save_index", wraps=vault.save_index) as mock_save:
+                vault._delete_notes_bulk([first.id, second.id], temp_dir)
+
+            mock_save.assert_called_once()
+            self.assertEqual(vault.get_all_titles(temp_dir), ["Third"])
+            self.assertFalse(
+                os.path.exists(vault._get_note_file_path(first.id, temp_dir))
+            )
+            results = vault.search_notes("pears", temp_dir)
+            self.assertEqual([note.title for note in results], ["Third"])
+
+    def test_delete_notes_bulk_not_found(self):
+        """Test bulk deletion removes nothing when any note is missing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = vault.create_note("First", "apples and pears", vault_path=temp_dir)
+
+            with self.assertRaises(NoteNotFoundError):
+                vault._delete_notes_bulk([first.id, "missing"], temp_dir)
+
+            self.assertEqual(vault.get_all_titles(temp_dir), ["First"])
+
     @patch("vault.core.load_index")
     def test_get_all_titles_success(self, mock_load_index):
         """Test get_all_titles with successful retrieval."""
@@ -612,6 +1091,19 @@ class TestVaultPersistence(unittest.TestCase):
         self.assertEqual(titles, [])
         mock_load_index.assert_called_once()
 
+    @patch("vault.core.load_index")
+    def test_iter_all_titles(self, mock_load_index):
+        """Test iter_all_titles yields titles lazily from one index load."""
+        mock_load_index.return_value = {
+            "notes": {"note1": {"title": "Note 1"}, "note2": {"title": "Note 2"}}
+        }
+
+        titles = vault.iter_all_titles()
+
+        self.assertEqual(next(titles), "Note 1")
+        self.assertEqual(list(titles), ["Note 2"])
+        mock_load_index.assert_called_once()
+
     @patch("vault.core.load_index")
     def test_get_all_titles_storage_error(self, mock_load_index):
         """Test get_all_titles with storage error."""
@@ -619,20 +1111,25 @@ class TestVaultPersistence(unittest.TestCase):
         mock_load_index.side_effect = StorageError("Test error")
 
         # Get titles and verify error
-        with self.assertRaises(StorageError) as context:
+        with self.assertRaisesRegex(
+            StorageError, "Failed to get note titles"
+        ) as context:
             get_all_titles()
 
         # Verify error
-        self.assertIn("Failed to get note titles", str(context.exception))
         self.assertIsInstance(context.exception.original_error, StorageError)
         mock_load_index.assert_called_once()
 
     def test_search_notes_success(self) -> None:
         """Test search_notes with successful matches."""
         # Create test notes
-        self.create_test_note("Test Note 1", "Content 1", ["tag1"])
-        self.create_test_note("Test Note 2", "Content 2", ["tag2"])
-        self.create_test_note("Other Note", "Test content", ["tag3"])
+        self._bootstrap_notes(
+            [
+                ("Test Note 1", "Content of note 1", ["tag1"]),
+                ("Test Note 2", "Content of note 2", ["tag2"]),
+                ("Other Note", "Test material", ["tag3"]),
+            ]
+        )
 
         # Test search in title
         results = vault.search_notes("Test Note")
@@ -654,7 +1151,7 @@ class TestVaultPersistence(unittest.TestCase):
     def test_search_notes_case_insensitive(self):
         """Test search_notes with case-insensitive matching."""
         # Create test note
-        self.create_test_note("Test Note", "Content", ["Tag"])
+        self._bootstrap_notes([("Test Note", "Some content", ["Tag"])])
 
         # Test different cases
         results = vault.search_notes("test")
@@ -672,7 +1169,7 @@ class TestVaultPersistence(unittest.TestCase):
     def test_search_notes_no_matches(self):
         """Test search_notes with no matching notes."""
         # Create test note
-        self.create_test_note("Test Note", "Content", ["tag"])
+        self._bootstrap_notes([("Test Note", "Some content", ["tag"])])
 
         # Search for non-existent term
         results = vault.search_notes("nonexistent")
@@ -681,7 +1178,7 @@ class TestVaultPersistence(unittest.TestCase):
     def test_search_notes_empty_index(self):
         """Test search_notes with empty index."""
         # Ensure index is empty
-        self._clear_index()
+        self._bootstrap_notes([])
 
         # Search in empty index
         results = vault.search_notes("test")
@@ -690,37 +1187,148 @@ class TestVaultPersistence(unittest.TestCase):
     def test_search_notes_storage_error(self):
         """Test search_notes with storage error."""
         # Create test note
-        self.create_test_note("Test Note", "Content", ["tag"])
+        self._bootstrap_notes([("Test Note", "Some content", ["tag"])])
 
         # Simulate storage error
         with patch("mpkv.vault.core.load_index") as mock_load:
             mock_load.side_effect = StorageError("Test error")
-            with self.assertRaises(StorageError) as context:
+            with self.assertRaisesRegex(StorageError, "Failed to search notes"):
                 vault.search_notes("test")
-            self.assertIn("Failed to search notes", str(context.exception))
 
     def test_search_notes_graceful_error_handling(self):
         """Test search_notes gracefully handles errors for individual notes."""
         # Create test notes
-        self.create_test_note("Test Note 1", "Content 1", ["tag1"])
-        self.create_test_note("Test Note 2", "Content 2", ["tag2"])
+        self._bootstrap_notes(
+            [
+                ("Test Note 1", "Content of note 1", ["tag1"]),
+                ("Test Note 2", "Content of note 2", ["tag2"]),
+            ]
+        )
 
         # Simulate error reading one note
         with patch("mpkv.vault.core._get_note_internal") as mock_get:
             mock_get.side_effect = [
                 StorageError("Test error"),
-                self.create_test_note("Test Note 2", "Content 2", ["tag2"]),
+                MagicMock(title="Test Note 2"),
             ]
             results = vault.search_notes("Test")
             self.assertEqual(len(results), 1)
             self.assertEqual(results[0].title, "Test Note 2")
 
+    def test_search_notes_uses_search_index(self):
+        """Test search_notes only reads notes the search index allows."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = vault.create_note("First", "apples and pears", vault_path=temp_dir)
+            vault.create_note("Second", "bananas only here", vault_path=temp_dir)
+            # The first search reads the new notes into the search index
+            vault.search_notes("apples", temp_dir)
+
+            with patch(
+                "vault.core._read_notes_bulk", wraps=vault._read_notes_bulk
+            ) as mock_read:
+                results = vault.search_notes("PEARS", temp_dir)
+
+        self.assertEqual([note.title for note in results], ["First"])
+        mock_read.assert_called_once_with([first.id], temp_dir)
+
+    def test_search_notes_reads_each_note_once(self):
+        """Test search_notes builds results from one read of each matching note."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = vault.create_note(
+                "Pears", "a title match here", vault_path=temp_dir
+            )
+            second = vault.create_note("Other", "pears in content", vault_path=temp_dir)
+            vault.search_notes("apples", temp_dir)
+
+            with patch(
+                "vault.core._read_notes_bulk", wraps=vault._read_notes_bulk
+            ) as mock_read, patch("vault.core.read_note_content") as mock_read_one:
+                results = vault.search_notes("pears", temp_dir)
+
+        self.assertEqual([note.id for note in results], [first.id, second.id])
+        self.assertEqual(results[0].content, "a title match here")
+        read_ids = [note_id for c in mock_read.call_args_list for note_id in c.args[0]]
+        self.assertCountEqual(read_ids, [first.id, second.id])
+        mock_read_one.assert_not_called()
+
+    def test_search_notes_updates_search_index_incrementally(self):
+        """Test creates and deletes leave the search index to the next search."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = vault.create_note("First", "apples and pears", vault_path=temp_dir)
+            search_index_path = vault.get_search_index_path(temp_dir)
+            self.assertFalse(os.path.exists(search_index_path))
+            vault.search_notes("apples", temp_dir)
+
+            second = vault.create_note("Second", "bananas only", vault_path=temp_dir)
+            _delete_note_internal(first.id, temp_dir)
+            with patch(
+                "vault.core._read_notes_bulk", wraps=vault._read_notes_bulk
+            ) as mock_read:
+                results = vault.search_notes("banana", temp_dir)
+
+            with open(search_index_path, encoding="utf-8") as f:
+                search_index = json.load(f)
+
+        self.assertEqual([note.title for note in results], ["Second"])
+        self.assertEqual(mock_read.call_args_list[0].args, ([second.id], temp_dir))
+        self.assertEqual(search_index["ids"], [second.id])
+
+    def test_search_notes_rebuilds_stale_search_index(self):
+        """Test search_notes rebuilds a search index that misses notes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vault.create_note("First", "apples and pears", vault_path=temp_dir)
+            vault.create_note("Second", "bananas only here", vault_path=temp_dir)
+            vault.search_notes("apples", temp_dir)
+            search_index_path = vault.get_search_index_path(temp_dir)
+            os.remove(search_index_path)
+
+            results = vault.search_notes("banana", temp_dir)
+
+            self.assertEqual([note.title for note in results], ["Second"])
+            self.assertTrue(os.path.exists(search_index_path))
+
+    def test_search_index_compacted_after_deletes(self):
+        """Test repeated create/delete cycles keep the search index bounded."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vault.create_note("Keeper", "apples and pears", vault_path=temp_dir)
+            for i in range(200):
+                vault.create_note(f"Temp {i}", "bananas only", vault_path=temp_dir)
+                vault.search_notes("bananas", temp_dir)
+                vault.delete_note_by_title(f"Temp {i}", temp_dir)
+            results = vault.search_notes("pears", temp_dir)
+
+            with open(vault.get_search_index_path(temp_dir), encoding="utf-8") as f:
+                search_index = json.load(f)
+
+        self.assertLessEqual(len(search_index["ids"]), 3)
+        self.assertEqual([note.title for note in results], ["Keeper"])
+
+    def test_search_index_failed_write_keeps_old_file(self):
+        """Test a failed search index save leaves the old file and no temp file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vault.create_note("First", "apples and pears", vault_path=temp_dir)
+            vault.search_notes("apples", temp_dir)
+            search_index_path = vault.get_search_index_path(temp_dir)
+            with open(search_index_path, encoding="utf-8") as f:
+                before = f.read()
+
+            with patch("os.replace", side_effect=OSError("Disk full")):
+                vault._save_search_index({"ids": [], "trigrams": {}}, temp_dir)
+
+            with open(search_index_path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), before)
+            self.assertFalse([name for name in os.listdir(temp_dir) if ".tmp" in name])
+
     def test_get_all_tags_with_counts_success(self):
         """Test get_all_tags_with_counts with successful retrieval."""
         # Create test notes with tags
-        self.create_test_note("Note 1", "Content 1", ["work", "personal"])
-        self.create_test_note("Note 2", "Content 2", ["work", "ideas"])
-        self.create_test_note("Note 3", "Content 3", ["personal"])
+        self._bootstrap_notes(
+            [
+                ("Note 1", "Content of note 1", ["work", "personal"]),
+                ("Note 2", "Content of note 2", ["work", "ideas"]),
+                ("Note 3", "Content of note 3", ["personal"]),
+            ]
+        )
 
         # Get tag counts
         tag_counts = vault.get_all_tags_with_counts()
@@ -731,7 +1339,7 @@ class TestVaultPersistence(unittest.TestCase):
     def test_get_all_tags_with_counts_empty(self):
         """Test get_all_tags_with_counts with no tags."""
         # Create test note without tags
-        self.create_test_note("Note 1", "Content 1")
+        self._bootstrap_notes([("Note 1", "Content of note 1")])
 
         # Get tag counts
         tag_counts = vault.get_all_tags_with_counts()
@@ -742,7 +1350,7 @@ class TestVaultPersistence(unittest.TestCase):
     def test_get_all_tags_with_counts_no_notes(self):
         """Test get_all_tags_with_counts with no notes."""
         # Ensure index is empty
-        self._clear_index()
+        self._bootstrap_notes([])
 
         # Get tag counts
         tag_counts = vault.get_all_tags_with_counts()
@@ -753,121 +1361,182 @@ class TestVaultPersistence(unittest.TestCase):
     def test_get_all_tags_with_counts_storage_error(self):
         """Test get_all_tags_with_counts with storage error."""
         # Create test note
-        self.create_test_note("Note 1", "Content 1", ["tag1"])
+        self._bootstrap_notes([("Note 1", "Content of note 1", ["tag1"])])
 
         # Simulate storage error
         with patch("vault.core.load_index") as mock_load:
             mock_load.side_effect = StorageError("Test error")
-            with self.assertRaises(StorageError) as context:
+            with self.assertRaisesRegex(StorageError, "Failed to get tag counts"):
                 vault.get_all_tags_with_counts()
-            self.assertIn("Failed to get tag counts", str(context.exception))
 
-    def test_export_notes_success(self):
-        """Test export_notes with successful export."""
-        # Create test notes
-        self.create_test_note("Test Note 1", "Content 1", ["tag1"])
-        self.create_test_note("Test Note 2", "Content 2", ["tag2"])
 
-        # Create temporary directory for export
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Export notes
-            vault.export_notes(temp_dir)
-
-            # Verify files were created
-            files = os.listdir(temp_dir)
-            self.assertEqual(len(files), 2)
-            self.assertIn("Test_Note_1.txt", files)
-            self.assertIn("Test_Note_2.txt", files)
-
-            # Verify file contents
-            with open(os.path.join(temp_dir, "Test_Note_1.txt"), encoding="utf-8") as f:
-                content = f.read()
-                self.assertIn("Title: Test Note 1", content)
-                self.assertIn("Content 1", content)
-
-    def test_export_notes_filename_sanitization(self):
-        """Test export_notes with filename sanitization."""
-        # Create test note with special characters
-        self.create_test_note("Test/Note*With?Special:Chars", "Content")
+# Index and note contents served to the export tests in place of a real vault
+_FAKE_INDEX = {
+    "notes": {
+        "n1": {"title": "Test Note 1", "tags": ["tag1"]},
+        "n2": {"title": "Test Note 2", "tags": ["tag2"]},
+    }
+}
+_FAKE_CONTENT = {"n1": "Content 1", "n2": "Content 2"}
 
-        # Create temporary directory for export
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Export notes
-            vault.export_notes(temp_dir)
 
-            # Verify file was created with sanitized name
-            files = os.listdir(temp_dir)
-            self.assertEqual(len(files), 1)
-            self.assertIn("Test_Note_With_Special_Chars.txt", files)
+def _fake_read_note_content(note_id, vault_path=None):
+    """Return a note's content from the fake vault."""
+    return _FAKE_CONTENT[note_id]
 
-    def test_export_notes_empty_title(self):
-        """Test export_notes with empty title."""
-        # Create test note with empty title
-        self.create_test_note("", "Content")
 
-        # Create temporary directory for export
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Export notes
-            vault.export_notes(temp_dir)
+class TestVaultExport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root shared by every export test."""
+        cls._tmp = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls._tmp, ignore_errors=True)
+        cls.export_dir = os.path.join(cls._tmp, "export")
+        cls.vault_dir = os.path.join(cls._tmp, "vault")
+
+    def setUp(self):
+        """Empty the shared root and recreate the export directory."""
+        _invalidate_index_cache()
+        with os.scandir(self._tmp) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        os.mkdir(self.export_dir)
+
+    def _names(self, directory: str) -> set:
+        """Return the names of the entries in a directory."""
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+
+    def _export_in_memory(self) -> dict:
+        """Run export_notes with exported files captured in memory by name."""
+        exported = {}
+        real_open = builtins.open
+
+        def fake_open(path, mode="r", *args, **kwargs):
+            if os.path.dirname(path) == self.export_dir and "w" in mode:
+                return _CapturedFile(exported, os.path.basename(path))
+            return real_open(path, mode, *args, **kwargs)
+
+        with patch("builtins.open", fake_open), patch("os.makedirs"):
+            vault.export_notes(self.export_dir)
+        return exported
+
+    @patch("vault.core.load_index", return_value=_FAKE_INDEX)
+    @patch("vault.core.read_note_content", side_effect=_fake_read_note_content)
+    def test_export_notes_success(self, mock_read, mock_load):
+        """Test export_notes with successful export."""
+        # Export notes
+        exported = self._export_in_memory()
+
+        # Verify files were created
+        self.assertEqual(len(exported), 2)
+        self.assertIn("Test_Note_1.txt", exported)
+        self.assertIn("Test_Note_2.txt", exported)
+
+        # Verify file contents
+        content = exported["Test_Note_1.txt"]
+        self.assertIn("Title: Test Note 1", content)
+        self.assertIn("Content 1", content)
+
+    @patch("vault.core.PARALLEL_EXPORT_THRESHOLD", 2)
+    @patch("vault.core.ThreadPoolExecutor", wraps=vault.ThreadPoolExecutor)
+    def test_export_notes_parallel_above_threshold(self, mock_executor):
+        """Test export_notes uses a thread pool for large vaults by default."""
+        vault.create_note("First", "First note content", vault_path=self.vault_dir)
+        vault.create_note("Second", "Second note content", vault_path=self.vault_dir)
+
+        vault.export_notes(self.export_dir, self.vault_dir)
+
+        mock_executor.assert_called_once()
+        self.assertEqual(self._names(self.export_dir), {"First.txt", "Second.txt"})
+
+    def test_export_notes_parallel_colliding_names(self):
+        """Test notes sharing an export file name are written in index order."""
+        titles = ["Draft: One", "Draft? One", "Draft/ One"]
+        index_data = {"notes": {f"n{i}": {"title": t} for i, t in enumerate(titles)}}
+
+        def slow_read(note_id, vault_path=None):
+            # Delay all but the last note, so a racing export would end on them
+            if note_id != "n2":
+                time.sleep(0.05)
+            return f"Content of {note_id}"
+
+        with patch("vault.core.load_index", return_value=index_data), patch(
+            "vault.core.read_note_content", side_effect=slow_read
+        ):
+            vault.export_notes(self.export_dir, max_workers=4)
+
+        self.assertEqual(self._names(self.export_dir), {"Draft__One.txt"})
+        with open(
+            os.path.join(self.export_dir, "Draft__One.txt"), encoding="utf-8"
+        ) as f:
+            self.assertEqual(f.read(), "Title: Draft/ One\n\nContent of n2")
+
+    @patch(
+        "vault.core.load_index",
+        return_value={"notes": {"n1": {"title": "Test/Note*With?Special:Chars"}}},
+    )
+    @patch("vault.core.read_note_content", side_effect=_fake_read_note_content)
+    def test_export_notes_filename_sanitization(self, mock_read, mock_load):
+        """Test export_notes with filename sanitization."""
+        # Export notes
+        exported = self._export_in_memory()
+
+        # Verify file was created with sanitized name
+        self.assertEqual(len(exported), 1)
+        self.assertIn("Test_Note_With_Special_Chars.txt", exported)
+
+    @patch("vault.core.load_index", return_value={"notes": {"n1": {"title": ""}}})
+    @patch("vault.core.read_note_content", side_effect=_fake_read_note_content)
+    def test_export_notes_empty_title(self, mock_read, mock_load):
+        """Test export_notes with empty title."""
+        # Export notes
+        exported = self._export_in_memory()
 
-            # Verify file was created with default name
-            files = os.listdir(temp_dir)
-            self.assertEqual(len(files), 1)
-            self.assertIn("untitled.txt", files)
+        # Verify file was created with default name
+        self.assertEqual(len(exported), 1)
+        self.assertIn("untitled.txt", exported)
 
-    def test_export_notes_no_notes(self):
+    @patch("vault.core.load_index", return_value={"notes": {}})
+    def test_export_notes_no_notes(self, mock_load):
         """Test export_notes with no notes."""
-        # Create temporary directory for export
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Export notes
-            vault.export_notes(temp_dir)
+        # Export notes
+        exported = self._export_in_memory()
 
-            # Verify no files were created
-            self.assertEqual(len(os.listdir(temp_dir)), 0)
+        # Verify no files were created
+        self.assertEqual(exported, {})
 
     def test_export_notes_storage_error(self):
         """Test export_notes with storage error."""
-        # Create test note
-        self.create_test_note("Test Note", "Content")
+        # Simulate storage error
+        with patch("vault.core.load_index") as mock_load:
+            mock_load.side_effect = StorageError("Test error")
+            with self.assertRaisesRegex(StorageError, "Failed to export notes"):
+                vault.export_notes(self.export_dir)
 
-        # Create temporary directory for export
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Simulate storage error
-            with patch("vault.core.load_index") as mock_load:
-                mock_load.side_effect = StorageError("Test error")
-                with self.assertRaises(StorageError) as context:
-                    vault.export_notes(temp_dir)
-                self.assertIn("Failed to export notes", str(context.exception))
-
-    def test_export_notes_os_error(self):
+    @patch("vault.core.load_index", return_value=_FAKE_INDEX)
+    def test_export_notes_os_error(self, mock_load):
         """Test export_notes with OSError."""
-        # Create test note
-        self.create_test_note("Test Note", "Content")
-
         # Simulate OSError
         with patch("os.makedirs") as mock_makedirs:
             mock_makedirs.side_effect = OSError("Permission denied")
-            with self.assertRaises(OSError) as context:
+            with self.assertRaisesRegex(OSError, "Failed to create output directory"):
                 vault.export_notes("/invalid/path")
-            self.assertIn("Failed to create output directory", str(context.exception))
 
-    def test_export_notes_graceful_error_handling(self):
+    @patch("vault.core.load_index", return_value=_FAKE_INDEX)
+    def test_export_notes_graceful_error_handling(self, mock_load):
         """Test export_notes gracefully handles errors for individual notes."""
-        # Create test notes
-        self.create_test_note("Test Note 1", "Content 1")
-        self.create_test_note("Test Note 2", "Content 2")
+        # Simulate error reading one note
+        with patch("vault.core.read_note_content") as mock_read:
+            mock_read.side_effect = [StorageError("Test error"), "Content 2"]
+            exported = self._export_in_memory()
 
-        # Create temporary directory for export
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Simulate error reading one note
-            with patch("vault.core.read_note_content") as mock_read:
-                mock_read.side_effect = [StorageError("Test error"), "Content 2"]
-                vault.export_notes(temp_dir)
-
-                # Verify only the successful note was exported
-                files = os.listdir(temp_dir)
-                self.assertEqual(len(files), 1)
-                self.assertIn("Test_Note_2.txt", files)
+            # Verify only the successful note was exported
+            self.assertEqual(len(exported), 1)
+            self.assertIn("Test_Note_2.txt", exported)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import re
 import unittest
 
 from vault.fields import BaseField, ContentField, TagsField, TitleField
@@ -21,6 +22,23 @@ class TestFields(unittest.TestCase):
     Test cases for field validation descriptors.
     """
 
+    VALID_TITLES = ("Test Title", "Title123", "Simple", "A" * 100)
+    INVALID_TITLES = ("Test-Title", "Title#123", "Simple!", "Title@home")
+    TOO_LONG_TITLE = "A" * 101  # One character too many
+    TOO_SHORT_CONTENT = "A" * 9  # One character too few
+    TOO_LONG_CONTENT = "A" * 10001  # One character too many
+    TOO_MANY_TAGS = tuple(f"tag{i}" for i in range(21))  # Default max is 20
+    TOO_LONG_TAG = "A" * 31  # Default max length is 30
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the model instance shared by every test in the class."""
+        cls.model = TestModel()
+
+    def setUp(self):
+        """Clear any field values left on the shared model by earlier tests."""
+        self.model.__dict__.clear()
+
     def test_base_field_required(self):
         """Test that BaseField validates required fields."""
 
@@ -28,9 +46,8 @@ class TestFields(unittest.TestCase):
             field = BaseField()
 
         model = TestBaseModel()
-        with self.assertRaises(ValueError) as context:
+        with self.assertRaisesRegex(ValueError, "required"):
             model.field = None
-        self.assertIn("required", str(context.exception))
 
     def test_base_field_optional(self):
         """Test that BaseField allows None for optional fields."""
@@ -44,21 +61,19 @@ class TestFields(unittest.TestCase):
 
     def test_title_field_valid(self):
         """Test that TitleField accepts valid titles."""
-        model = TestModel()
-        valid_titles = ["Test Title", "Title123", "Simple", "A" * 100]
-
-        for title in valid_titles:
-            model.title = title
-            self.assertEqual(model.title, title)
+        model = self.model
+        for title in self.VALID_TITLES:
+            with self.subTest(title=title):
+                model.title = title
+                self.assertEqual(model.title, title)
 
     def test_title_field_required(self):
         """Test that TitleField enforces required constraint."""
-        model = TestModel()
+        model = self.model
 
         # Should raise error when setting required field to None
-        with self.assertRaises(ValueError) as context:
+        with self.assertRaisesRegex(ValueError, "required"):
             model.title = None
-        self.assertIn("required", str(context.exception))
 
         # Should not raise error when setting optional field to None
         model.optional_title = None
@@ -66,26 +81,32 @@ class TestFields(unittest.TestCase):
 
     def test_title_field_max_length(self):
         """Test that TitleField enforces maximum length."""
-        model = TestModel()
-        too_long_title = "A" * 101  # One character too many
-
-        with self.assertRaises(ValueError) as context:
-            model.title = too_long_title
-        self.assertIn("must not exceed", str(context.exception))
+        model = self.model
+        with self.assertRaisesRegex(ValueError, "must not exceed"):
+            model.title = self.TOO_LONG_TITLE
 
     def test_title_field_invalid_characters(self):
         """Test that TitleField validates character constraints."""
-        model = TestModel()
-        invalid_titles = ["Test-Title", "Title#123", "Simple!", "Title@home"]
-
-        for title in invalid_titles:
-            with self.assertRaises(ValueError) as context:
-                model.title = title
-            self.assertIn("invalid character", str(context.exception))
+        model = self.model
+        for title in self.INVALID_TITLES:
+            with self.subTest(title=title):
+                with self.assertRaisesRegex(ValueError, "invalid character"):
+                    model.title = title
+
+    def test_title_field_pattern_is_precompiled(self):
+        """Test that TitleField validates with one class-level compiled pattern."""
+        self.assertIsInstance(TitleField._PATTERN, re.Pattern)
+        self.assertIs(TitleField()._PATTERN, TestModel.title._PATTERN)
+
+        # The pattern accepts exactly what isalnum/isspace accept
+        for char in "aZ9 \té_-!":
+            with self.subTest(char=char):
+                allowed = char.isalnum() or char.isspace()
+                self.assertEqual(TitleField._PATTERN.search(char) is None, allowed)
 
     def test_title_field_get_set(self):
         """Test that TitleField properly gets and sets values."""
-        model = TestModel()
+        model = self.model
         model.title = "My Title"
         self.assertEqual(model.title, "My Title")
 
@@ -94,7 +115,7 @@ class TestFields(unittest.TestCase):
 
     def test_content_field_valid(self):
         """Test that ContentField accepts valid content."""
-        model = TestModel()
+        model = self.model
 
         # Just above minimum length
         model.content = "A" * 10
@@ -111,12 +132,11 @@ class TestFields(unittest.TestCase):
 
     def test_content_field_required(self):
         """Test that ContentField enforces required constraint."""
-        model = TestModel()
+        model = self.model
 
         # Should raise error when setting required field to None
-        with self.assertRaises(ValueError) as context:
+        with self.assertRaisesRegex(ValueError, "required"):
             model.content = None
-        self.assertIn("required", str(context.exception))
 
         # Should not raise error when setting optional field to None
         model.optional_content = None
@@ -124,25 +144,19 @@ class TestFields(unittest.TestCase):
 
     def test_content_field_min_length(self):
         """Test that ContentField enforces minimum length."""
-        model = TestModel()
-        too_short_content = "A" * 9  # One character too few
-
-        with self.assertRaises(ValueError) as context:
-            model.content = too_short_content
-        self.assertIn("must be at least", str(context.exception))
+        model = self.model
+        with self.assertRaisesRegex(ValueError, "must be at least"):
+            model.content = self.TOO_SHORT_CONTENT
 
     def test_content_field_max_length(self):
         """Test that ContentField enforces maximum length."""
-        model = TestModel()
-        too_long_content = "A" * 10001  # One character too many
-
-        with self.assertRaises(ValueError) as context:
-            model.content = too_long_content
-        self.assertIn("must not exceed", str(context.exception))
+        model = self.model
+        with self.assertRaisesRegex(ValueError, "must not exceed"):
+            model.content = self.TOO_LONG_CONTENT
 
     def test_content_field_get_set(self):
         """Test that ContentField properly gets and sets values."""
-        model = TestModel()
+        model = self.model
         content = "This is some content that is at least 10 characters."
         model.content = content
         self.assertEqual(model.content, content)
@@ -152,7 +166,7 @@ class TestFields(unittest.TestCase):
 
     def test_tags_field_valid_string_to_list(self):
         """Test that TagsField converts comma-separated strings to lists."""
-        model = TestModel()
+        model = self.model
 
         # Single tag
         model.tags = "python"
@@ -164,14 +178,14 @@ class TestFields(unittest.TestCase):
 
     def test_tags_field_stripping_whitespace(self):
         """Test that TagsField strips whitespace from tags."""
-        model = TestModel()
+        model = self.model
 
         model.tags = "  python  ,  tutorial  ,  code  "
         self.assertEqual(model.tags, ["python", "tutorial", "code"])
 
     def test_tags_field_empty_input(self):
         """Test that TagsField handles empty input."""
-        model = TestModel()
+        model = self.model
 
         # Empty string
         model.tags = ""
@@ -187,16 +201,15 @@ class TestFields(unittest.TestCase):
 
     def test_tags_field_required(self):
         """Test that TagsField enforces required constraint."""
-        model = TestModel()
+        model = self.model
 
         # Should raise error when setting required field to None
-        with self.assertRaises(ValueError) as context:
+        with self.assertRaisesRegex(ValueError, "required"):
             model.required_tags = None
-        self.assertIn("required", str(context.exception))
 
     def test_tags_field_list_input(self):
         """Test that TagsField accepts list input."""
-        model = TestModel()
+        model = self.model
 
         # List of tags
         model.tags = ["python", "tutorial", "code"]
@@ -208,29 +221,22 @@ class TestFields(unittest.TestCase):
 
     def test_tags_field_max_tags(self):
         """Test that TagsField enforces maximum number of tags."""
-        model = TestModel()
-
-        # Create a list with 21 tags (exceeding the default max of 20)
-        too_many_tags = [f"tag{i}" for i in range(21)]
+        model = self.model
 
-        with self.assertRaises(ValueError) as context:
-            model.tags = too_many_tags
-        self.assertIn("cannot have more than", str(context.exception))
+        # TagsField only accepts lists, so the shared tuple is copied
+        with self.assertRaisesRegex(ValueError, "cannot have more than"):
+            model.tags = list(self.TOO_MANY_TAGS)
 
     def test_tags_field_max_tag_length(self):
         """Test that TagsField enforces maximum tag length."""
-        model = TestModel()
-
-        # Tag that exceeds the default max length of 30
-        too_long_tag = "A" * 31
+        model = self.model
 
-        with self.assertRaises(ValueError) as context:
-            model.tags = [too_long_tag]
-        self.assertIn("exceeds maximum length", str(context.exception))
+        with self.assertRaisesRegex(ValueError, "exceeds maximum length"):
+            model.tags = [self.TOO_LONG_TAG]
 
     def test_tags_field_get_set(self):
         """Test that TagsField properly gets and sets values."""
-        model = TestModel()
+        model = self.model
         model.tags = "python, tutorial"
         self.assertEqual(model.tags, ["python", "tutorial"])
 
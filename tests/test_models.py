@@ -1,30 +1,58 @@
+import copy
 import datetime
 import unittest
 import uuid
+from unittest.mock import patch
 
 from vault.models import Note
 
+# Fixed identifiers and timestamps shared by the construction tests
+_TEST_UUID = str(uuid.uuid4())
+_TEST_NOW = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+_TEST_NOW_ISO = _TEST_NOW.isoformat()
+
 
 class TestNote(unittest.TestCase):
     """
     Test cases for the Note model.
     """
 
+    VALID_TITLE = "Test Note"
+    VALID_CONTENT = "This is a test note with sufficient content for validation."
+    VALID_TAGS = "test, note, unittest"
+    TOO_LONG_TITLE = "A" * 101  # One character too many
+    TOO_LONG_CONTENT = "A" * 10001  # One character too many
+    TOO_LONG_TAG = "A" * 31  # One character too many
+    TOO_MANY_TAGS = ",".join(f"tag{i}" for i in range(21))  # Max is 20
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the prototype note that every test works on a copy of."""
+        cls._proto = Note(
+            title=cls.VALID_TITLE, content=cls.VALID_CONTENT, tags=cls.VALID_TAGS
+        )
+
     def setUp(self):
         """Set up test fixtures."""
-        self.valid_title = "Test Note"
-        self.valid_content = (
-            "This is a test note with sufficient content for validation."
-        )
-        self.valid_tags = "test, note, unittest"
+        self.note = self._make_note()
+
+    def _make_note(self, **overrides) -> Note:
+        """Return a copy of the prototype note with the given fields replaced.
+
+        Overrides go through the field descriptors, so they are still validated.
+        """
+        note = copy.copy(self._proto)
+        for name, value in overrides.items():
+            setattr(note, name, value)
+        return note
 
     def test_init_minimal(self):
         """Test creation of a Note with minimal parameters."""
-        note = Note(title=self.valid_title, content=self.valid_content)
+        note = Note(title=self.VALID_TITLE, content=self.VALID_CONTENT)
 
         # Check required attributes
-        self.assertEqual(note.title, self.valid_title)
-        self.assertEqual(note.content, self.valid_content)
+        self.assertEqual(note.title, self.VALID_TITLE)
+        self.assertEqual(note.content, self.VALID_CONTENT)
 
         # Check defaults
         self.assertIsNone(note.tags)
@@ -37,15 +65,15 @@ class TestNote(unittest.TestCase):
 
     def test_init_with_all_params(self):
         """Test creation of a Note with all parameters specified."""
-        test_id = str(uuid.uuid4())
+        test_id = _TEST_UUID
         test_created = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
         test_modified = datetime.datetime(2023, 1, 2, tzinfo=datetime.timezone.utc)
         test_filename = "custom_filename.md"
 
         note = Note(
-            title=self.valid_title,
-            content=self.valid_content,
-            tags=self.valid_tags,
+            title=self.VALID_TITLE,
+            content=self.VALID_CONTENT,
+            tags=self.VALID_TAGS,
             id=test_id,
             created_at=test_created,
             last_modified=test_modified,
@@ -53,8 +81,8 @@ class TestNote(unittest.TestCase):
         )
 
         # Check all attributes
-        self.assertEqual(note.title, self.valid_title)
-        self.assertEqual(note.content, self.valid_content)
+        self.assertEqual(note.title, self.VALID_TITLE)
+        self.assertEqual(note.content, self.VALID_CONTENT)
         self.assertEqual(note.tags, ["test", "note", "unittest"])
         self.assertEqual(note.id, test_id)
         self.assertEqual(note.created_at, test_created)
@@ -67,119 +95,99 @@ class TestNote(unittest.TestCase):
         test_modified = "2023-01-02T00:00:00+00:00"
 
         note = Note(
-            title=self.valid_title,
-            content=self.valid_content,
+            title=self.VALID_TITLE,
+            content=self.VALID_CONTENT,
             created_at=test_created,
             last_modified=test_modified,
         )
 
         # Check datetime conversion
-        self.assertIsInstance(note.created_at, datetime.datetime)
-        self.assertIsInstance(note.last_modified, datetime.datetime)
-        self.assertEqual(note.created_at.year, 2023)
-        self.assertEqual(note.created_at.month, 1)
-        self.assertEqual(note.created_at.day, 1)
-        self.assertEqual(note.last_modified.year, 2023)
-        self.assertEqual(note.last_modified.month, 1)
-        self.assertEqual(note.last_modified.day, 2)
-
-    def test_init_with_tag_list(self):
-        """Test creation of a Note with tags provided as a list."""
-        tag_list = ["test", "note", "unittest"]
-
-        note = Note(title=self.valid_title, content=self.valid_content, tags=tag_list)
+        self.assertEqual(
+            note.created_at,
+            datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(
+            note.last_modified,
+            datetime.datetime(2023, 1, 2, tzinfo=datetime.timezone.utc),
+        )
 
-        self.assertEqual(note.tags, tag_list)
+    def test_tag_parsing(self):
+        """Test that tags given as a string or a list parse to the same list."""
+        expected = ["test", "note", "unittest"]
+        for tags in (self.VALID_TAGS, ["test", "note", "unittest"]):
+            with self.subTest(tags=tags):
+                note = Note(
+                    title=self.VALID_TITLE, content=self.VALID_CONTENT, tags=tags
+                )
+                self.assertEqual(note.tags, expected)
 
     def test_validation_title(self):
         """Test that the title field is properly validated."""
-        # Test required validation
-        with self.assertRaises(ValueError):
-            Note(title=None, content=self.valid_content)
-
-        # Test length validation
-        with self.assertRaises(ValueError):
-            Note(title="A" * 101, content=self.valid_content)
-
-        # Test character validation
-        with self.assertRaises(ValueError):
-            Note(title="Invalid-Title!", content=self.valid_content)
+        invalid_titles = (
+            None,  # Required
+            self.TOO_LONG_TITLE,
+            "Invalid-Title!",  # Invalid characters
+        )
+        for title in invalid_titles:
+            with self.subTest(title=title):
+                with self.assertRaises(ValueError):
+                    Note(title=title, content=self.VALID_CONTENT)
 
     def test_validation_content(self):
         """Test that the content field is properly validated."""
-        # Test required validation
-        with self.assertRaises(ValueError):
-            Note(title=self.valid_title, content=None)
-
-        # Test minimum length validation
-        with self.assertRaises(ValueError):
-            Note(title=self.valid_title, content="Too short")
-
-        # Test maximum length validation
-        with self.assertRaises(ValueError):
-            Note(title=self.valid_title, content="A" * 10001)
+        invalid_contents = (
+            None,  # Required
+            "Too short",  # Below minimum length
+            self.TOO_LONG_CONTENT,
+        )
+        for content in invalid_contents:
+            with self.subTest(content=content):
+                with self.assertRaises(ValueError):
+                    Note(title=self.VALID_TITLE, content=content)
 
     def test_validation_tags(self):
         """Test that the tags field is properly validated."""
-        # Test maximum tag count
-        too_many_tags = ",".join([f"tag{i}" for i in range(21)])  # 21 tags
-        with self.assertRaises(ValueError):
-            Note(title=self.valid_title, content=self.valid_content, tags=too_many_tags)
-
-        # Test maximum tag length
-        long_tag = "A" * 31  # 31 characters
-        with self.assertRaises(ValueError):
-            Note(
-                title=self.valid_title,
-                content=self.valid_content,
-                tags=f"normal,{long_tag}",
-            )
+        invalid_tags = (
+            self.TOO_MANY_TAGS,
+            f"normal,{self.TOO_LONG_TAG}",
+        )
+        for tags in invalid_tags:
+            with self.subTest(tags=tags):
+                with self.assertRaises(ValueError):
+                    Note(title=self.VALID_TITLE, content=self.VALID_CONTENT, tags=tags)
 
     def test_attribute_access(self):
         """Test accessing attributes directly and via descriptors."""
-        note = Note(
-            title=self.valid_title, content=self.valid_content, tags=self.valid_tags
-        )
+        note = self.note
 
         # Direct access
-        self.assertEqual(note.title, self.valid_title)
-        self.assertEqual(note.content, self.valid_content)
+        self.assertEqual(note.title, self.VALID_TITLE)
+        self.assertEqual(note.content, self.VALID_CONTENT)
         self.assertEqual(note.tags, ["test", "note", "unittest"])
 
         # Descriptor access from class should return descriptor instance
-        self.assertNotEqual(Note.title, self.valid_title)
-        self.assertNotEqual(Note.content, self.valid_content)
+        self.assertNotEqual(Note.title, self.VALID_TITLE)
+        self.assertNotEqual(Note.content, self.VALID_CONTENT)
         self.assertNotEqual(Note.tags, ["test", "note", "unittest"])
 
     def test_to_dict(self):
         """Test conversion of Note to dictionary."""
-        note = Note(
-            title=self.valid_title, content=self.valid_content, tags=self.valid_tags
-        )
-
-        result = note.to_dict()
-
-        # Check structure
-        self.assertIsInstance(result, dict)
-        self.assertIn("id", result)
-        self.assertIn("title", result)
-        self.assertIn("tags", result)
-        self.assertIn("created_at", result)
-        self.assertIn("last_modified", result)
-        self.assertIn("filename", result)
+        note = self.note
 
-        # Check values
-        self.assertEqual(result["id"], note.id)
-        self.assertEqual(result["title"], self.valid_title)
-        self.assertEqual(result["tags"], ["test", "note", "unittest"])
-
-        # Check timestamps format (should be ISO strings)
-        self.assertIsInstance(result["created_at"], str)
-        self.assertIsInstance(result["last_modified"], str)
+        # Timestamps are serialized as ISO strings
+        expected = {
+            "id": note.id,
+            "title": self.VALID_TITLE,
+            "tags": ["test", "note", "unittest"],
+            "created_at": note.created_at.isoformat(),
+            "last_modified": note.last_modified.isoformat(),
+            "filename": note.filename,
+        }
+        self.assertEqual(note.to_dict(), expected)
 
     def test_to_dict_without_tags(self):
         """Test conversion of Note without tags to dictionary."""
-        note = Note(title=self.valid_title, content=self.valid_content)
+        note = Note(title=self.VALID_TITLE, content=self.VALID_CONTENT)
 
         result = note.to_dict()
 
@@ -188,25 +196,24 @@ class TestNote(unittest.TestCase):
 
     def test_from_dict(self):
         """Test creation of Note from dictionary and content."""
-        test_id = str(uuid.uuid4())
-        now = datetime.datetime.now(datetime.timezone.utc)
-        now_iso = now.isoformat()
+        test_id = _TEST_UUID
+        now_iso = _TEST_NOW_ISO
 
         data = {
             "id": test_id,
-            "title": self.valid_title,
+            "title": self.VALID_TITLE,
             "tags": ["test", "note", "unittest"],
             "created_at": now_iso,
             "last_modified": now_iso,
             "filename": f"{test_id}.txt",
         }
 
-        note = Note.from_dict(data, self.valid_content)
+        note = Note.from_dict(data, self.VALID_CONTENT)
 
         # Check attributes
         self.assertEqual(note.id, test_id)
-        self.assertEqual(note.title, self.valid_title)
-        self.assertEqual(note.content, self.valid_content)
+        self.assertEqual(note.title, self.VALID_TITLE)
+        self.assertEqual(note.content, self.VALID_CONTENT)
         self.assertEqual(note.tags, ["test", "note", "unittest"])
         self.assertEqual(note.filename, f"{test_id}.txt")
 
@@ -218,75 +225,83 @@ class TestNote(unittest.TestCase):
         """Test creation of Note from minimal dictionary."""
         # Only provide required fields
         data = {
-            "id": str(uuid.uuid4()),
-            "title": self.valid_title,
+            "id": _TEST_UUID,
+            "title": self.VALID_TITLE,
         }
 
-        note = Note.from_dict(data, self.valid_content)
+        note = Note.from_dict(data, self.VALID_CONTENT)
 
         # Check required fields
         self.assertEqual(note.id, data["id"])
-        self.assertEqual(note.title, self.valid_title)
-        self.assertEqual(note.content, self.valid_content)
+        self.assertEqual(note.title, self.VALID_TITLE)
+        self.assertEqual(note.content, self.VALID_CONTENT)
 
         # Check defaults
         self.assertEqual(note.tags, [])  # Empty list from to_dict
 
     def test_update_methods(self):
         """Test the update methods for title, content, and tags."""
-        note = Note(
-            title=self.valid_title, content=self.valid_content, tags=self.valid_tags
-        )
-
+        note = self.note
         original_modified = note.last_modified
 
-        # Wait a small amount to ensure timestamps will differ
-        import time
+        # Advance a fake clock one second per call instead of sleeping
+        ticks = [original_modified]
+
+        def fake_now(tz=None):
+            ticks.append(ticks[-1] + datetime.timedelta(seconds=1))
+            return ticks[-1]
 
-        time.sleep(0.001)
+        with patch("vault.models.datetime") as mock_datetime:
+            mock_datetime.timezone = datetime.timezone
+            mock_datetime.datetime.now.side_effect = fake_now
 
-        # Test update_title
-        new_title = "Updated Title"
-        note.update_title(new_title)
-        self.assertEqual(note.title, new_title)
-        self.assertGreater(note.last_modified, original_modified)
+            # Test update_title
+            new_title = "Updated Title"
+            note.update_title(new_title)
+            self.assertEqual(note.title, new_title)
+            self.assertEqual(note.last_modified, ticks[-1])
+            self.assertGreater(note.last_modified, original_modified)
 
-        # Save the new last_modified time
-        title_modified = note.last_modified
-        time.sleep(0.001)
+            # Save the new last_modified time
+            title_modified = note.last_modified
+
+            # Test update_content
+            new_content = (
+                "This is updated content with sufficient length for validation."
+            )
+            note.update_content(new_content)
+            self.assertEqual(note.content, new_content)
+            self.assertEqual(note.last_modified, ticks[-1])
+            self.assertGreater(note.last_modified, title_modified)
 
-        # Test update_content
-        new_content = "This is updated content with sufficient length for validation."
-        note.update_content(new_content)
-        self.assertEqual(note.content, new_content)
-        self.assertGreater(note.last_modified, title_modified)
+            # Save the new last_modified time
+            content_modified = note.last_modified
 
-        # Save the new last_modified time
-        content_modified = note.last_modified
-        time.sleep(0.001)
+            # Test update_tags
+            new_tags = "updated, tags"
+            note.update_tags(new_tags)
+            self.assertEqual(note.tags, ["updated", "tags"])
+            self.assertEqual(note.last_modified, ticks[-1])
+            self.assertGreater(note.last_modified, content_modified)
 
-        # Test update_tags
-        new_tags = "updated, tags"
-        note.update_tags(new_tags)
-        self.assertEqual(note.tags, ["updated", "tags"])
-        self.assertGreater(note.last_modified, content_modified)
+        mock_datetime.datetime.now.assert_called_with(datetime.timezone.utc)
 
     def test_repr(self):
         """Test the string representation of a Note."""
-        note = Note(title=self.valid_title, content=self.valid_content)
+        note = self.note
 
         repr_str = repr(note)
 
         # Check that the representation includes the title
-        self.assertIn(self.valid_title, repr_str)
+        self.assertIn(self.VALID_TITLE, repr_str)
         self.assertIn("Note", repr_str)
 
     def test_str(self):
         """Test the __str__ method of Note."""
-        note = Note(title=self.valid_title, content=self.valid_content)
+        note = self.note
         str_output = str(note)
-        self.assertIn(self.valid_title, str_output)
-        self.assertIn(self.valid_content, str_output)
+        self.assertIn(self.VALID_TITLE, str_output)
+        self.assertIn(self.VALID_CONTENT, str_output)
 
 
 if __name__ == "__main__":
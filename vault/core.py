@@ -1,8 +1,16 @@
 import json
 import logging
+import marshal
 import os
 import os.path
+import sys
+import tempfile
+import threading
 import uuid
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
 
 from vault.errors import DuplicateTitleError, NoteNotFoundError, StorageError
 from vault.models import Note
@@ -14,6 +22,31 @@ logger = logging.getLogger(__name__)
 VAULT_DIR_NAME = ".mpkv"
 NOTES_SUBDIR_NAME = "notes"
 INDEX_FILENAME = "index.json"
+SEARCH_INDEX_FILENAME = "search_index.json"
+
+# Exports with fewer notes than this are written serially by default
+PARALLEL_EXPORT_THRESHOLD = 32
+
+# Bulk reads of fewer notes than this are done serially
+PARALLEL_READ_THRESHOLD = 32
+
+# The search index is compacted once more than this share of its slots are removed notes
+SEARCH_INDEX_COMPACT_RATIO = 0.5
+
+# Setting this environment variable makes every index read go to disk
+NO_CACHE_ENV_VAR = "MPKV_NO_CACHE"
+
+# Parsed index files keyed by path, with the (inode, mtime_ns, size) they were
+# read at. Atomic writes give the file a new inode, so a rewrite is noticed
+# even when the size and timestamp match. The data is kept marshalled, so it
+# can't be changed through a loaded copy.
+_INDEX_CACHE: dict[str, tuple[tuple[int, int, int], bytes]] = {}
+_INDEX_CACHE_LOCK = threading.Lock()
+
+# Vault directories already created or confirmed by this process
+_ENSURED_PATHS: set[str] = set()
+
+_T = TypeVar("_T")
 
 
 def get_vault_path(custom_path: str | None = None) -> str:
@@ -71,7 +104,9 @@ def ensure_vault_dirs_exist(vault_path: str | None = None) -> tuple[str, str]:
     Ensure that the vault directory structure exists.
 
     This function creates the main vault directory and its subdirectories
-    if they don't already exist.
+    if they don't already exist. Once a vault has been confirmed, later calls
+    for the same path return immediately without touching the filesystem;
+    writes that find a directory gone use _write_in_vault to recreate it.
 
     Args:
         vault_path: Optional custom vault path (resolved if not provided)
@@ -87,6 +122,8 @@ def ensure_vault_dirs_exist(vault_path: str | None = None) -> tuple[str, str]:
         ('/home/user/.mpkv', '/home/user/.mpkv/notes')
     """
     vault_dir, notes_dir = get_vault_subdirs(vault_path)
+    if vault_dir in _ENSURED_PATHS:
+        return vault_dir, notes_dir
 
     try:
         # Create the main vault directory if it doesn't exist
@@ -101,9 +138,37 @@ def ensure_vault_dirs_exist(vault_path: str | None = None) -> tuple[str, str]:
         logger.error(f"Failed to create vault directories: {e}")
         raise
 
+    _ENSURED_PATHS.add(vault_dir)
     return vault_dir, notes_dir
 
 
+def _write_in_vault(write: Callable[[], _T], vault_path: str | None = None) -> _T:
+    """
+    Run a write into the vault, recreating its directories if they vanished.
+
+    ensure_vault_dirs_exist trusts a vault it has already confirmed, so a
+    vault or notes directory removed while the process runs would make every
+    later write fail. On FileNotFoundError the vault is forgotten, its
+    directories are created again and the write is retried once.
+
+    Args:
+        write: The function that performs the write
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Returns:
+        The result of the write
+
+    Raises:
+        OSError: If the write fails again, or the directories cannot be created
+    """
+    try:
+        return write()
+    except FileNotFoundError:
+        _ENSURED_PATHS.discard(get_vault_path(vault_path))
+        ensure_vault_dirs_exist(vault_path)
+        return write()
+
+
 def get_index_path(vault_path: str | None = None) -> str:
     """
     Get the path to the vault index file.
@@ -122,6 +187,115 @@ def get_index_path(vault_path: str | None = None) -> str:
     return os.path.join(vault_dir, INDEX_FILENAME)
 
 
+def _invalidate_index_cache() -> None:
+    """
+    Drop every cached index so the next load_index call reads from disk.
+
+    Examples:
+        >>> _invalidate_index_cache()
+    """
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE.clear()
+
+
+def _file_version(stat: os.stat_result) -> tuple[int, int, int]:
+    """
+    Get the values that identify one version of a file for the index cache.
+
+    Args:
+        stat: The file's stat result
+
+    Returns:
+        The file's (inode, mtime_ns, size)
+    """
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _read_json_cached(path: str, prepare: Callable[[dict], None] | None = None) -> dict:
+    """
+    Read a JSON file, reusing the parsed data while the file is unchanged.
+
+    When the MPKV_NO_CACHE environment variable is set to a non-empty value,
+    the cache is neither consulted nor filled and the file is always parsed.
+
+    Args:
+        path: The path of the JSON file
+        prepare: Optional function run on freshly parsed data before it is cached
+
+    Returns:
+        The parsed data, as a fresh object the caller is free to change
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file contains invalid JSON
+    """
+    use_cache = not os.environ.get(NO_CACHE_ENV_VAR)
+    version = _file_version(os.stat(path))
+
+    if use_cache:
+        with _INDEX_CACHE_LOCK:
+            cached = _INDEX_CACHE.get(path)
+        if cached is not None and cached[0] == version:
+            # Unmarshalling is much cheaper than parsing JSON or deep-copying
+            return marshal.loads(cached[1])
+
+    # Parse the raw bytes; json decodes UTF-8 itself, so no text layer
+    with open(path, "rb") as f:
+        data = json.loads(f.read())
+    if prepare is not None:
+        prepare(data)
+
+    if not use_cache:
+        return data
+
+    frozen = marshal.dumps(data)
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE[path] = (version, frozen)
+    return data
+
+
+def _remember_written(path: str, data: dict, stat: os.stat_result) -> None:
+    """
+    Record a copy of just-written data as the cached contents of a JSON file.
+
+    The stat must come from the written file itself, not from the path, so
+    a file another writer put there since is never cached as this data.
+
+    Args:
+        path: The path of the JSON file
+        data: The data that was written to it
+        stat: The stat of the file taken through its descriptor while writing
+    """
+    if os.environ.get(NO_CACHE_ENV_VAR):
+        return
+
+    frozen = marshal.dumps(data)
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE[path] = (_file_version(stat), frozen)
+
+
+def _intern_tags(index_data: dict) -> None:
+    """
+    Replace every tag in a freshly parsed index with its interned string.
+
+    Tags repeat across many notes, so interning leaves the cached index with
+    one string object per distinct tag instead of one per note and tag.
+
+    Args:
+        index_data: The parsed index, updated in place
+    """
+    notes = index_data.get("notes") if isinstance(index_data, dict) else None
+    if not isinstance(notes, dict):
+        return
+
+    for note_data in notes.values():
+        tags = note_data.get("tags") if isinstance(note_data, dict) else None
+        if isinstance(tags, list):
+            note_data["tags"] = [
+                sys.intern(tag) if isinstance(tag, str) else tag for tag in tags
+            ]
+
+
 def load_index(vault_path: str | None = None) -> dict:
     """
     Load the vault index from the index file.
@@ -130,6 +304,12 @@ def load_index(vault_path: str | None = None) -> dict:
     If the file doesn't exist, returns an empty dictionary. If the file exists but
     contains invalid JSON, raises a StorageError.
 
+    Parsed indexes are cached per path and reused while the file's modification
+    time and size are unchanged. Tag strings are interned when the file is
+    parsed. Every call returns a fresh copy, so callers may change it without
+    affecting the cache. Set the MPKV_NO_CACHE environment variable to always
+    read the index from disk.
+
     Args:
         vault_path: Optional custom vault path (resolved if not provided)
 
@@ -146,8 +326,7 @@ def load_index(vault_path: str | None = None) -> dict:
     index_path = get_index_path(vault_path)
 
     try:
-        with open(index_path, encoding="utf-8") as f:
-            return json.load(f)
+        return _read_json_cached(index_path, _intern_tags)
     except FileNotFoundError:
         return {}
     except json.JSONDecodeError as e:
@@ -156,13 +335,79 @@ def load_index(vault_path: str | None = None) -> dict:
         raise StorageError(error_msg, original_error=e) from e
 
 
+def _fsync_dir(directory: str) -> None:
+    """
+    Flush a directory's entries to disk, so a rename in it survives a crash.
+
+    Not every platform can open a directory for syncing (Windows cannot), so
+    this is best effort.
+
+    Args:
+        directory: The directory to sync
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _atomic_write(path: str, data: bytes) -> os.stat_result:
+    """
+    Replace a file's contents without ever leaving it partly written.
+
+    The data goes to a uniquely named temporary file next to the target, so
+    concurrent writers never share one, is flushed to disk and then renamed
+    over the target. The directory is then synced so the rename is durable.
+    On failure the temporary file is removed.
+
+    Args:
+        path: The file to write
+        data: The complete new contents of the file
+
+    Returns:
+        The stat of the written file, taken through its descriptor
+
+    Raises:
+        OSError: If the file cannot be written or replaced
+    """
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            stat = os.fstat(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    _fsync_dir(directory)
+    return stat
+
+
 def save_index(index_data: dict, vault_path: str | None = None) -> None:
     """
     Save the vault index to the index file.
 
     This function ensures the vault directory exists, then writes the index data
-    as formatted JSON to the index file. The JSON is written with an indent of 4
-    spaces for readability.
+    as compact JSON to the index file, without indentation or spaces after
+    separators, to keep it small. The data goes to a temporary file next to the
+    index, is flushed to disk and then renamed over the index, so a crash
+    mid-write never leaves a truncated index behind. The saved data also becomes the
+    cached index for this path.
 
     Args:
         index_data: The dictionary containing the index data to save
@@ -179,15 +424,259 @@ def save_index(index_data: dict, vault_path: str | None = None) -> None:
     ensure_vault_dirs_exist(vault_path)
     index_path = get_index_path(vault_path)
 
+    data = json.dumps(index_data, separators=(",", ":")).encode("utf-8")
+
     try:
-        with open(index_path, "w", encoding="utf-8") as f:
-            json.dump(index_data, f, indent=4)
+        stat = _write_in_vault(lambda: _atomic_write(index_path, data), vault_path)
         logger.debug(f"Index saved to {index_path}")
     except OSError as e:
+        # The file's state is uncertain, so the next load reads it again
+        with _INDEX_CACHE_LOCK:
+            _INDEX_CACHE.pop(index_path, None)
         error_msg = f"Failed to save index to {index_path}: {e}"
         logger.error(error_msg)
         raise StorageError(error_msg, original_error=e) from e
 
+    # Keep the cache in step with what was just written
+    _remember_written(index_path, index_data, stat)
+
+
+def get_search_index_path(vault_path: str | None = None) -> str:
+    """
+    Get the path to the vault's search index file.
+
+    Args:
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Returns:
+        The absolute path to the search index file
+
+    Examples:
+        >>> get_search_index_path()
+        '/home/user/.mpkv/search_index.json'
+    """
+    vault_dir = get_vault_path(vault_path)
+    return os.path.join(vault_dir, SEARCH_INDEX_FILENAME)
+
+
+def _trigrams(text: str) -> set[str]:
+    """
+    Get the set of lowercased three-character substrings of a text.
+
+    Args:
+        text: The text to split into trigrams
+
+    Returns:
+        The distinct trigrams of the lowercased text
+
+    Examples:
+        >>> sorted(_trigrams("Note"))
+        ['not', 'ote']
+    """
+    text = text.lower()
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _load_search_index(vault_path: str | None = None) -> dict:
+    """
+    Load the search index, or an empty one if it is missing or unreadable.
+
+    The search index maps each content trigram to the positions, in its "ids"
+    list, of the notes containing it. It is derived data, so any problem
+    reading it is treated as an empty index to be rebuilt.
+
+    Args:
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Returns:
+        A dictionary with "ids" and "trigrams" entries
+    """
+    try:
+        return _read_json_cached(get_search_index_path(vault_path))
+    except (OSError, ValueError):
+        return {"ids": [], "trigrams": {}}
+
+
+def _save_search_index(search_index: dict, vault_path: str | None = None) -> None:
+    """
+    Save the search index as compact JSON.
+
+    The file is replaced atomically, the same way as the vault index.
+    Failures are logged rather than raised: a missing or outdated search
+    index is brought up to date by the next search.
+
+    Args:
+        search_index: The search index to save
+        vault_path: Optional custom vault path (resolved if not provided)
+    """
+    search_index_path = get_search_index_path(vault_path)
+
+    try:
+        stat = _atomic_write(
+            search_index_path,
+            json.dumps(search_index, separators=(",", ":")).encode("utf-8"),
+        )
+    except OSError as e:
+        logger.warning(f"Failed to save search index to {search_index_path}: {e}")
+        with _INDEX_CACHE_LOCK:
+            _INDEX_CACHE.pop(search_index_path, None)
+        return
+
+    _remember_written(search_index_path, search_index, stat)
+
+
+def _add_to_search_index(search_index: dict, notes: Iterable[tuple[str, str]]) -> None:
+    """
+    Append notes to a search index in place.
+
+    Args:
+        search_index: The search index to extend
+        notes: (note ID, content) pairs of the notes to add
+    """
+    ids = search_index.setdefault("ids", [])
+    postings = search_index.setdefault("trigrams", {})
+
+    for note_id, content in notes:
+        position = len(ids)
+        ids.append(note_id)
+        for trigram in _trigrams(content):
+            postings.setdefault(trigram, []).append(position)
+
+
+def _remove_from_search_index(search_index: dict, note_ids: Iterable[str]) -> dict:
+    """
+    Remove notes from a search index.
+
+    Each note's slot in "ids" is left as None so the positions of the other
+    notes stay valid, and its posting list entries are left in place. Once
+    more than SEARCH_INDEX_COMPACT_RATIO of the slots are removed notes, the
+    index is compacted.
+
+    Args:
+        search_index: The search index to remove the notes from, changed in place
+        note_ids: The unique identifiers of the notes to remove
+
+    Returns:
+        The search index, which is a new dictionary if it was compacted
+    """
+    ids = search_index.get("ids", [])
+    removed = set(note_ids)
+    for position, note_id in enumerate(ids):
+        if note_id in removed:
+            ids[position] = None
+    if ids.count(None) > len(ids) * SEARCH_INDEX_COMPACT_RATIO:
+        return _compact_search_index(search_index)
+    return search_index
+
+
+def _compact_search_index(search_index: dict) -> dict:
+    """
+    Drop the slots of removed notes from a search index.
+
+    The remaining notes are renumbered in order, and posting list entries of
+    removed notes are dropped along with any posting lists left empty.
+
+    Args:
+        search_index: The search index to compact
+
+    Returns:
+        The compacted search index
+    """
+    new_positions: dict[int, int] = {}
+    ids: list[str] = []
+    for position, note_id in enumerate(search_index.get("ids", [])):
+        if note_id is not None:
+            new_positions[position] = len(ids)
+            ids.append(note_id)
+
+    postings: dict[str, list[int]] = {}
+    for trigram, trigram_positions in search_index.get("trigrams", {}).items():
+        remaining = [new_positions[p] for p in trigram_positions if p in new_positions]
+        if remaining:
+            postings[trigram] = remaining
+
+    return {"ids": ids, "trigrams": postings}
+
+
+def _sync_search_index(
+    search_index: dict, all_note_ids: set[str], vault_path: str | None = None
+) -> dict:
+    """
+    Bring a search index up to date with the notes in the vault index.
+
+    Creating and deleting notes does not touch the search index. Instead the
+    next search drops the notes that are gone and reads and adds only the
+    notes that are new, then saves the index once. A missing index is
+    therefore built from every note.
+
+    Args:
+        search_index: The loaded search index, changed in place
+        all_note_ids: The IDs of every note in the vault index
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Returns:
+        The up-to-date search index
+    """
+    indexed = set(search_index.get("ids", [])) - {None}
+    if indexed == all_note_ids:
+        return search_index
+
+    search_index = _remove_from_search_index(search_index, indexed - all_note_ids)
+    added = [note_id for note_id in all_note_ids if note_id not in indexed]
+    contents = _read_notes_bulk(added, vault_path)
+    _add_to_search_index(
+        search_index,
+        ((note_id, contents.get(note_id, "")) for note_id in added),
+    )
+    _save_search_index(search_index, vault_path)
+    return search_index
+
+
+def _content_candidates(
+    term_lower: str,
+    note_ids: list[str],
+    all_note_ids: Iterable[str],
+    vault_path: str | None = None,
+) -> list[str]:
+    """
+    Narrow a list of notes to those whose content may contain a term.
+
+    A note can only contain the term if it contains every trigram of the term,
+    so the candidates are the intersection of the term's posting lists. The
+    search index is first brought up to date with the vault index, which
+    reads only the notes added since the last search. Terms shorter than
+    three characters cannot be narrowed.
+
+    Args:
+        term_lower: The lowercased search term
+        note_ids: The notes to narrow down, in the order to return them
+        all_note_ids: The IDs of every note in the vault index
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Returns:
+        The notes from note_ids that may contain the term
+    """
+    search_index = _sync_search_index(
+        _load_search_index(vault_path), set(all_note_ids), vault_path
+    )
+    ids = search_index.get("ids", [])
+
+    term_trigrams = _trigrams(term_lower)
+    if not term_trigrams:
+        return note_ids
+
+    # Intersect the shortest posting lists first
+    postings = search_index.get("trigrams", {})
+    lists = sorted((postings.get(t, []) for t in term_trigrams), key=len)
+    positions = set(lists[0])
+    for other in lists[1:]:
+        if not positions:
+            break
+        positions.intersection_update(other)
+
+    candidates = {ids[position] for position in positions}
+    return [note_id for note_id in note_ids if note_id in candidates]
+
 
 def generate_note_id() -> str:
     """
@@ -225,7 +714,9 @@ def _get_note_file_path(note_id: str, vault_path: str | None = None) -> str:
         '/home/user/.mpkv/notes/123e4567-e89b-12d3-a456-426614174000.txt'
     """
     _, notes_dir = get_vault_subdirs(vault_path)
-    return os.path.join(notes_dir, f"{note_id}.txt")
+    # notes_dir is already absolute and normalized, so plain concatenation
+    # gives the same result as os.path.join without its per-call parsing
+    return f"{notes_dir}{os.sep}{note_id}.txt"
 
 
 def read_note_content(note_id: str, vault_path: str | None = None) -> str:
@@ -264,19 +755,91 @@ def read_note_content(note_id: str, vault_path: str | None = None) -> str:
         raise StorageError(error_msg, original_error=e) from e
 
 
+def _default_max_workers() -> int:
+    """
+    Get the default number of threads for overlapping note file I/O.
+
+    Returns:
+        min(32, 4 * CPU count), as the threads mostly wait on the disk
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _read_note_file(note_path: str) -> str | None:
+    """
+    Read a note file, or return None if it is missing or unreadable.
+
+    Args:
+        note_path: The path of the note's content file
+
+    Returns:
+        The file's content, or None if it could not be read
+    """
+    try:
+        with open(note_path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Failed to read note content from {note_path}: {e}")
+        return None
+
+
+def _read_notes_bulk(
+    note_ids: Iterable[str], vault_path: str | None = None
+) -> dict[str, str]:
+    """
+    Read the content of several notes in one pass.
+
+    The notes directory is resolved once for the whole batch instead of once
+    per note. Batches of at least PARALLEL_READ_THRESHOLD notes are read from
+    a thread pool, overlapping the per-file disk I/O. Notes whose files are
+    missing or unreadable are left out of the result rather than aborting the
+    batch.
+
+    Args:
+        note_ids: The unique identifiers of the notes to read
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Returns:
+        A dictionary mapping each readable note ID to its content
+
+    Examples:
+        >>> _read_notes_bulk(['123e4567-e89b-12d3-a456-426614174000'])
+        {'123e4567-e89b-12d3-a456-426614174000': 'This is the note content'}
+    """
+    _, notes_dir = get_vault_subdirs(vault_path)
+    note_ids = list(note_ids)
+    note_paths = [f"{notes_dir}{os.sep}{note_id}.txt" for note_id in note_ids]
+
+    if len(note_paths) >= PARALLEL_READ_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=_default_max_workers()) as executor:
+            contents = list(executor.map(_read_note_file, note_paths))
+    else:
+        contents = [_read_note_file(note_path) for note_path in note_paths]
+
+    return {
+        note_id: content
+        for note_id, content in zip(note_ids, contents)
+        if content is not None
+    }
+
+
 def write_note_content(
-    note_id: str, content: str, vault_path: str | None = None
+    note_id: str, content: str, vault_path: str | None = None, fsync: bool = False
 ) -> None:
     """
     Write content to a note's file.
 
     This function ensures the vault directory exists, then writes the note's
-    content to its file. If there are file system errors, raises StorageError.
+    content to its file as UTF-8 bytes in a single write. If there are file
+    system errors, raises StorageError.
 
     Args:
         note_id: The unique identifier of the note
         content: The content to write to the note's file
         vault_path: Optional custom vault path (resolved if not provided)
+        fsync: Whether to flush the file to disk before returning
 
     Raises:
         StorageError: If there are file system errors while writing
@@ -288,9 +851,15 @@ def write_note_content(
     ensure_vault_dirs_exist(vault_path)
     note_path = _get_note_file_path(note_id, vault_path)
 
+    def write() -> None:
+        with open(note_path, "wb") as f:
+            f.write(content.encode("utf-8"))
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
     try:
-        with open(note_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        _write_in_vault(write, vault_path)
         logger.debug(f"Note content written to {note_path}")
     except OSError as e:
         error_msg = f"Failed to write note content to {note_path}: {e}"
@@ -298,6 +867,68 @@ def write_note_content(
         raise StorageError(error_msg, original_error=e) from e
 
 
+def _title_index(index_data: dict) -> dict[str, str]:
+    """
+    Get the index's title-to-ID mapping, rebuilding it if it is stale.
+
+    The mapping is stored in the index under "title_to_id" so title lookups
+    are a single dictionary probe. Indexes written before it existed, or by
+    code that did not maintain it, are detected by a size mismatch with the
+    notes and rebuilt from them; the rebuilt mapping is persisted by the next
+    index save.
+
+    Args:
+        index_data: The loaded index data
+
+    Returns:
+        A dictionary mapping note titles to note IDs, which may be the one
+        stored in index_data
+    """
+    notes = index_data.get("notes", {})
+    title_to_id = index_data.get("title_to_id")
+    if isinstance(title_to_id, dict) and len(title_to_id) == len(notes):
+        return title_to_id
+
+    title_to_id = {}
+    for note_id, note_data in notes.items():
+        title_to_id.setdefault(note_data.get("title"), note_id)
+    return title_to_id
+
+
+def _lookup_title(index_data: dict, title: str) -> str | None:
+    """
+    Look up a note's ID by its title in the index's title-to-ID mapping.
+
+    A stored mapping can be out of date with the right size, for example
+    after a note was renamed by hand. A hit is therefore checked against the
+    note's own title. A miss, or a hit on a note with a different title, falls
+    back to a scan of the notes, so only lookups that find their note
+    straight away are a single dictionary probe. The scan is linear in the
+    number of notes, like loading the index that precedes it.
+
+    Args:
+        index_data: The loaded index data
+        title: The title to look up
+
+    Returns:
+        The ID of the note with the given title, or None if not found
+    """
+    notes = index_data.get("notes", {})
+    note_id = _title_index(index_data).get(title)
+    if note_id is not None and notes.get(note_id, {}).get("title") == title:
+        return note_id
+
+    # The mapping is stale or the title is absent; the notes are authoritative
+    return next(
+        (
+            note_id
+            for note_id, note_data in notes.items()
+            if note_data.get("title") == title
+        ),
+        None,
+    )
+
+
 def _create_note_internal(note: Note, vault_path: str | None = None) -> None:
     """
     Create a new note in the vault.
@@ -305,7 +936,7 @@ def _create_note_internal(note: Note, vault_path: str | None = None) -> None:
     This internal function handles the complete process of creating a note:
     1. Writing the note's content to a file
     2. Loading the current index
-    3. Adding the note's metadata to the index
+    3. Adding the note's metadata and title to the index
     4. Saving the updated index
 
     Args:
@@ -320,19 +951,7 @@ def _create_note_internal(note: Note, vault_path: str | None = None) -> None:
         >>> _create_note_internal(note)
     """
     try:
-        # Write note content to file
-        write_note_content(note.id, note.content, vault_path)
-
-        # Load current index
-        index_data = load_index(vault_path)
-        if "notes" not in index_data:
-            index_data["notes"] = {}
-
-        # Add note metadata to index
-        index_data["notes"][note.id] = note.to_dict()
-
-        # Save updated index
-        save_index(index_data, vault_path)
+        _create_notes_bulk([note], vault_path)
 
     except StorageError as e:
         # Re-raise StorageError with more context
@@ -341,6 +960,57 @@ def _create_note_internal(note: Note, vault_path: str | None = None) -> None:
         ) from e
 
 
+def _create_notes_bulk(notes: list[Note], vault_path: str | None = None) -> None:
+    """
+    Create several notes in the vault with a single index save.
+
+    Each note's content is written to its file, then the index is loaded and
+    saved once for the whole batch. The search index is not touched; the next
+    search reads the new notes into it. If a content file cannot be written,
+    the files already written for the batch are removed and the index is left
+    untouched.
+
+    Args:
+        notes: The Note objects to create
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Raises:
+        StorageError: If there are any file system errors during the process
+
+    Examples:
+        >>> _create_notes_bulk([Note(title="My Note", content="Note content")])
+    """
+    # Write every note's content before touching the index
+    written = []
+    try:
+        for note in notes:
+            write_note_content(note.id, note.content, vault_path)
+            written.append(note.id)
+    except StorageError:
+        for note_id in written:
+            try:
+                os.remove(_get_note_file_path(note_id, vault_path))
+            except OSError:
+                pass
+        raise
+
+    # Load current index, with a title mapping that can be extended
+    index_data = load_index(vault_path)
+    index_data = {
+        **index_data,
+        "notes": dict(index_data.get("notes", {})),
+        "title_to_id": dict(_title_index(index_data)),
+    }
+
+    # Add each note's metadata to the index
+    for note in notes:
+        index_data["notes"][note.id] = note.to_dict()
+        index_data["title_to_id"][note.title] = note.id
+
+    # Save updated index
+    save_index(index_data, vault_path)
+
+
 def _get_note_internal(note_id: str, vault_path: str | None = None) -> Note:
     """
     Get a note from the vault by its ID.
@@ -370,11 +1040,11 @@ def _get_note_internal(note_id: str, vault_path: str | None = None) -> Note:
     try:
         # Load current index
         index_data = load_index(vault_path)
-        if "notes" not in index_data or note_id not in index_data["notes"]:
+        note_data = index_data.get("notes", {}).get(note_id)
+        if note_data is None:
             raise NoteNotFoundError(note_id)
 
-        # Get note metadata and content
-        note_data = index_data["notes"][note_id]
+        # Get note content
         content = read_note_content(note_id, vault_path)
 
         # Create and return Note object
@@ -413,47 +1083,86 @@ def _delete_note_internal(note_id: str, vault_path: str | None = None) -> None:
     Examples:
         >>> _delete_note_internal('123e4567-e89b-12d3-a456-426614174000')
     """
-    try:
-        # Load current index
-        index_data = load_index(vault_path)
-        if "notes" not in index_data or note_id not in index_data["notes"]:
-            raise NoteNotFoundError(note_id)
+    _delete_notes_bulk([note_id], vault_path)
 
-        # Get note filename and remove file
-        note_data = index_data["notes"][note_id]
-        filename = note_data.get("filename")
-        if filename:
-            note_path = _get_note_file_path(note_id, vault_path)
-            try:
-                os.remove(note_path)
-            except FileNotFoundError:
-                # Ignore if file is already gone
-                pass
-            except OSError as e:
-                raise StorageError(
-                    f"Failed to remove note file: {e}", original_error=e
-                ) from e
 
-        # Remove note from index and save
-        del index_data["notes"][note_id]
-        save_index(index_data, vault_path)
+def _delete_notes_bulk(note_ids: Iterable[str], vault_path: str | None = None) -> None:
+    """
+    Delete several notes from the vault with a single index save.
+
+    Every ID is checked against the index before anything is removed, so a
+    missing note leaves the vault untouched. The note files are then removed,
+    and the index is saved once for the whole batch. The search index is not
+    touched; the next search drops the deleted notes from it.
+    If a file cannot be removed, the notes deleted before it are still saved
+    as deleted before the error is raised.
+
+    Args:
+        note_ids: The unique identifiers of the notes to delete
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Raises:
+        NoteNotFoundError: If any of the notes doesn't exist in the index
+        StorageError: If there are any file system errors during the process
+
+    Examples:
+        >>> _delete_notes_bulk(['123e4567-e89b-12d3-a456-426614174000'])
+    """
+    note_ids = list(dict.fromkeys(note_ids))
+    try:
+        # Load current index and check every note before touching any file
+        index_data = load_index(vault_path)
+        notes = dict(index_data.get("notes", {}))
+        for note_id in note_ids:
+            if note_id not in notes:
+                raise NoteNotFoundError(note_id)
+        title_to_id = dict(_title_index(index_data))
+
+        # Remove each note's file, then drop it from the index copy
+        removed = []
+        error = None
+        for note_id in note_ids:
+            if notes[note_id].get("filename"):
+                note_path = _get_note_file_path(note_id, vault_path)
+                try:
+                    os.remove(note_path)
+                except FileNotFoundError:
+                    # Ignore if file is already gone
+                    pass
+                except OSError as e:
+                    error = e
+                    break
+            title = notes.pop(note_id).get("title")
+            if title_to_id.get(title) == note_id:
+                del title_to_id[title]
+            removed.append(note_id)
+
+        # Save whatever was removed, even if a later file could not be
+        if removed:
+            save_index(
+                {**index_data, "notes": notes, "title_to_id": title_to_id},
+                vault_path,
+            )
+
+        if error is not None:
+            raise StorageError(
+                f"Failed to remove note file: {error}", original_error=error
+            ) from error
 
     except (NoteNotFoundError, StorageError):
         # Re-raise the original error
         raise
     except Exception as e:
         # Wrap unexpected errors in StorageError
-        raise StorageError(
-            f"Failed to delete note '{note_id}': {e}", original_error=e
-        ) from e
+        raise StorageError(f"Failed to delete notes: {e}", original_error=e) from e
 
 
 def _find_note_id_by_title(title: str, vault_path: str | None = None) -> str | None:
     """
     Find a note's ID by its title.
 
-    This function searches through the vault index to find a note with the
-    given title. If found, returns its ID; otherwise, returns None.
+    This function looks the title up in the vault index's title-to-ID
+    mapping. If found, returns its ID; otherwise, returns None.
 
     Args:
         title: The title to search for
@@ -470,15 +1179,7 @@ def _find_note_id_by_title(title: str, vault_path: str | None = None) -> str | N
         '123e4567-e89b-12d3-a456-426614174000'
     """
     try:
-        index_data = load_index(vault_path)
-        if "notes" not in index_data:
-            return None
-
-        for note_id, note_data in index_data["notes"].items():
-            if note_data.get("title") == title:
-                return note_id
-
-        return None
+        return _lookup_title(load_index(vault_path), title)
 
     except StorageError as e:
         # Re-raise StorageError with more context
@@ -550,6 +1251,65 @@ def create_note(
         ) from e
 
 
+def create_notes_bulk(
+    notes: Iterable[tuple[str, str, str | list[str] | None]],
+    vault_path: str | None = None,
+) -> list[Note]:
+    """
+    Create several notes in the vault with a single index save.
+
+    Every note is validated and checked for a duplicate title, against the
+    vault and within the batch, before anything is written, so an invalid
+    entry leaves the vault untouched. The notes are then created together,
+    loading and saving the index once instead of once per note.
+
+    Args:
+        notes: (title, content, tags) tuples describing the notes to create,
+            where tags may be None, a comma-separated string or a list
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Returns:
+        The created Note objects, in the order given
+
+    Raises:
+        DuplicateTitleError: If a title already exists or repeats in the batch
+        ValueError: If any note's data fails validation
+        StorageError: If there are any file system errors during the process
+
+    Examples:
+        >>> notes = create_notes_bulk([("First", "First content", "tag1"),
+        ...                            ("Second", "Second content", None)])
+        >>> [note.title for note in notes]
+        ['First', 'Second']
+    """
+    try:
+        # Ensure vault directory exists
+        ensure_vault_dirs_exist(vault_path)
+
+        # Validate every note and check titles before writing anything
+        index_data = load_index(vault_path)
+        seen_titles = set()
+        created = []
+        for title, content, tags in notes:
+            if _lookup_title(index_data, title) is not None or title in seen_titles:
+                raise DuplicateTitleError(title)
+            seen_titles.add(title)
+            created.append(
+                Note(title=title, content=content, tags=tags, id=generate_note_id())
+            )
+
+        if created:
+            _create_notes_bulk(created, vault_path)
+        return created
+
+    except (DuplicateTitleError, ValueError):
+        # Re-raise validation errors
+        raise
+    except StorageError as e:
+        # Re-raise StorageError with more context
+        raise StorageError(f"Failed to create notes: {e}", original_error=e) from e
+
+
 def get_note_by_title(title: str, vault_path: str | None = None) -> Note:
     """
     Get a note from the vault by its title.
@@ -627,6 +1387,37 @@ def delete_note_by_title(title: str, vault_path: str | None = None) -> None:
         ) from e
 
 
+def iter_all_titles(vault_path: str | None = None) -> Iterator[str]:
+    """
+    Iterate over all note titles in the vault.
+
+    The index is loaded when this function is called, so storage errors are
+    raised straight away, but titles are produced lazily. Callers that only
+    need part of the list can stop early without building it.
+
+    Args:
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Returns:
+        An iterator over the note titles
+
+    Raises:
+        StorageError: If there are any file system errors during the process
+
+    Examples:
+        >>> next(iter_all_titles())
+        'Note 1'
+    """
+    try:
+        notes = load_index(vault_path).get("notes", {})
+    except StorageError as e:
+        # Re-raise StorageError with more context
+        raise StorageError(f"Failed to get note titles: {e}", original_error=e) from e
+
+    # Titles come straight from the index; no note files are read
+    return (note_data.get("title", "") for note_data in notes.values())
+
+
 def get_all_titles(vault_path: str | None = None) -> list[str]:
     """
     Get a list of all note titles in the vault.
@@ -647,19 +1438,7 @@ def get_all_titles(vault_path: str | None = None) -> list[str]:
         >>> get_all_titles()
         ['Note 1', 'Note 2', 'Note 3']
     """
-    try:
-        # Load index and extract titles
-        index_data = load_index(vault_path)
-        if "notes" not in index_data:
-            return []
-
-        return [
-            note_data.get("title", "") for note_data in index_data["notes"].values()
-        ]
-
-    except StorageError as e:
-        # Re-raise StorageError with more context
-        raise StorageError(f"Failed to get note titles: {e}", original_error=e) from e
+    return list(iter_all_titles(vault_path))
 
 
 def search_notes(term: str, vault_path: str | None = None) -> list[Note]:
@@ -672,6 +1451,10 @@ def search_notes(term: str, vault_path: str | None = None) -> list[Note]:
     2. Note tags
     3. Note content
 
+    Content is narrowed with the trigram search index before any note file is
+    read. The first search after notes were created or deleted also reads the
+    new notes and rewrites the search index once; later searches only load it.
+
     Args:
         term: The search term to look for
         vault_path: Optional custom vault path (resolved if not provided)
@@ -694,40 +1477,44 @@ def search_notes(term: str, vault_path: str | None = None) -> list[Note]:
 
         # Convert search term to lowercase for case-insensitive search
         term_lower = term.lower()
-        matching_notes = []
+        matching_ids = set()
+        unmatched_ids = []
 
-        # Search through each note
+        # Check titles and tags from the index
         for note_id, note_data in index_data["notes"].items():
-            # Check title
             title = note_data.get("title", "").lower()
-            if term_lower in title:
-                try:
-                    note = _get_note_internal(note_id, vault_path)
-                    matching_notes.append(note)
-                    continue
-                except (NoteNotFoundError, StorageError):
-                    # Skip this note if we can't read it
-                    continue
-
-            # Check tags
-            tags = [tag.lower() for tag in note_data.get("tags", [])]
-            if any(term_lower in tag for tag in tags):
-                try:
-                    note = _get_note_internal(note_id, vault_path)
-                    matching_notes.append(note)
-                    continue
-                except (NoteNotFoundError, StorageError):
-                    # Skip this note if we can't read it
-                    continue
-
-            # Check content
+            tags = note_data.get("tags", [])
+            if term_lower in title or any(term_lower in tag.lower() for tag in tags):
+                matching_ids.add(note_id)
+            else:
+                unmatched_ids.append(note_id)
+
+        # Check content of the remaining notes that the search index allows
+        candidates = _content_candidates(
+            term_lower, unmatched_ids, index_data["notes"], vault_path
+        )
+        contents = _read_notes_bulk(candidates, vault_path)
+        content_matches = {
+            note_id
+            for note_id, content in contents.items()
+            if term_lower in content.lower()
+        }
+
+        # Read the title and tag matches, whose content is still needed
+        if matching_ids:
+            contents.update(_read_notes_bulk(list(matching_ids), vault_path))
+        matching_ids.update(content_matches)
+
+        # Build matching notes in index order from the content already read
+        matching_notes = []
+        for note_id, note_data in index_data["notes"].items():
+            if note_id not in matching_ids or note_id not in contents:
+                # Skip notes that don't match or whose content can't be read
+                continue
             try:
-                content = read_note_content(note_id, vault_path).lower()
-                if term_lower in content:
-                    note = _get_note_internal(note_id, vault_path)
-                    matching_notes.append(note)
-            except (NoteNotFoundError, StorageError):
-                # Skip this note if we can't read it
+                matching_notes.append(Note.from_dict(note_data, contents[note_id]))
+            except ValueError:
+                # Skip notes whose stored data is invalid
                 continue
 
         return matching_notes
@@ -749,7 +1536,7 @@ def get_all_tags_with_counts(vault_path: str | None = None) -> dict[str, int]:
         vault_path: Optional custom vault path (resolved if not provided)
 
     Returns:
-        A dictionary mapping tag names to their usage counts
+        A Counter (a dict subclass) mapping tag names to their usage counts
 
     Raises:
         StorageError: If there are any file system errors during the process
@@ -759,35 +1546,114 @@ def get_all_tags_with_counts(vault_path: str | None = None) -> dict[str, int]:
         {'work': 3, 'personal': 2, 'ideas': 1}
     """
     try:
-        # Load index
-        index_data = load_index(vault_path)
-        if "notes" not in index_data:
-            return {}
-
-        # Aggregate tag counts
-        tag_counts: dict[str, int] = {}
-        for note_data in index_data["notes"].values():
-            for tag in note_data.get("tags", []):
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-        return tag_counts
+        # Aggregate tag counts from the index in one pass
+        notes = load_index(vault_path).get("notes", {})
+        return Counter(
+            tag for note_data in notes.values() for tag in note_data.get("tags", ())
+        )
 
     except StorageError as e:
         # Re-raise StorageError with more context
         raise StorageError(f"Failed to get tag counts: {e}", original_error=e) from e
 
 
-def export_notes(output_dir: str, vault_path: str | None = None) -> None:
+def _export_filename(title: str) -> str:
+    """
+    Get the file name a note with the given title is exported to.
+
+    Args:
+        title: The note's title
+
+    Returns:
+        The sanitized title with a .txt extension
+
+    Examples:
+        >>> _export_filename("My Note: Draft")
+        'My_Note__Draft.txt'
+    """
+    # Replace invalid characters with underscores
+    safe_title = "".join(c if c.isalnum() or c in " -_" else "_" for c in title)
+    # Replace spaces with underscores
+    safe_title = safe_title.replace(" ", "_")
+    # Ensure filename is not empty
+    if not safe_title:
+        safe_title = "untitled"
+    return f"{safe_title}.txt"
+
+
+def _export_note(
+    note_id: str, note_data: dict, output_dir: str, vault_path: str | None = None
+) -> None:
+    """
+    Export a single note to a text file in the output directory.
+
+    Missing or unreadable notes are logged and skipped so that one bad note
+    does not abort the whole export.
+
+    Args:
+        note_id: The ID of the note to export
+        note_data: The note's metadata from the index
+        output_dir: The directory to export the note to
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Raises:
+        OSError: If the output file cannot be written
+    """
+    try:
+        # Get note content
+        content = read_note_content(note_id, vault_path)
+        title = note_data.get("title", "Untitled")
+
+        # Construct output path
+        output_path = os.path.join(output_dir, _export_filename(title))
+
+        # Write header and content as one encoded buffer in a single write
+        with open(output_path, "wb") as f:
+            f.write(f"Title: {title}\n\n{content}".encode())
+
+    except (NoteNotFoundError, StorageError) as e:
+        # Log error but continue with other notes
+        logger.warning(f"Failed to export note '{note_id}': {e}")
+
+
+def _export_note_group(
+    group: list[tuple[str, dict]], output_dir: str, vault_path: str | None = None
+) -> None:
+    """
+    Export notes that share an output file, one after another in order.
+
+    Args:
+        group: (note ID, metadata) pairs of the notes, in index order
+        output_dir: The directory to export the notes to
+        vault_path: Optional custom vault path (resolved if not provided)
+
+    Raises:
+        OSError: If an output file cannot be written
+    """
+    for note_id, note_data in group:
+        _export_note(note_id, note_data, output_dir, vault_path)
+
+
+def export_notes(
+    output_dir: str, vault_path: str | None = None, max_workers: int | None = None
+) -> None:
     """
     Export all notes to individual text files in the specified directory.
 
     This function exports all notes from the vault to individual text files in
     the specified output directory. Each file is named after the note's title
     (sanitized for filesystem use) and contains the note's title and content.
+    With more than one worker the files are written from a thread pool,
+    overlapping the per-file disk I/O. By default, exports of at least
+    PARALLEL_EXPORT_THRESHOLD notes use min(32, 4 * CPU count) workers and
+    smaller ones are written serially. Notes whose titles sanitize to the same
+    file name are always written one after another in index order, so the last
+    of them wins, as in a serial export.
 
     Args:
         output_dir: The directory to export notes to
         vault_path: Optional custom vault path (resolved if not provided)
+        max_workers: Number of notes to write concurrently (default: automatic)
 
     Raises:
         StorageError: If there are any file system errors during the process
@@ -795,6 +1661,7 @@ def export_notes(output_dir: str, vault_path: str | None = None) -> None:
 
     Examples:
         >>> export_notes("/path/to/export")
+        >>> export_notes("/path/to/export", max_workers=8)
     """
     try:
         # Load index
@@ -806,35 +1673,27 @@ def export_notes(output_dir: str, vault_path: str | None = None) -> None:
         os.makedirs(output_dir, exist_ok=True)
 
         # Export each note
-        for note_id, note_data in index_data["notes"].items():
-            try:
-                # Get note content
-                content = read_note_content(note_id, vault_path)
-                title = note_data.get("title", "Untitled")
-
-                # Sanitize title for filename
-                # Replace invalid characters with underscores
-                safe_title = "".join(
-                    c if c.isalnum() or c in " -_" else "_" for c in title
-                )
-                # Replace spaces with underscores
-                safe_title = safe_title.replace(" ", "_")
-                # Ensure filename is not empty
-                if not safe_title:
-                    safe_title = "untitled"
-
-                # Construct output path
-                output_path = os.path.join(output_dir, f"{safe_title}.txt")
-
-                # Write note to file
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(f"Title: {title}\n\n")
-                    f.write(content)
-
-            except (NoteNotFoundError, StorageError) as e:
-                # Log error but continue with other notes
-                logger.warning(f"Failed to export note '{note_id}': {e}")
-                continue
+        notes = index_data["notes"]
+        if max_workers is None:
+            max_workers = (
+                _default_max_workers() if len(notes) >= PARALLEL_EXPORT_THRESHOLD else 1
+            )
+        if max_workers > 1 and len(notes) > 1:
+            # One task per output file, so notes that share a file never race
+            groups: dict[str, list[tuple[str, dict]]] = {}
+            for note_id, note_data in notes.items():
+                filename = _export_filename(note_data.get("title", "Untitled"))
+                groups.setdefault(filename, []).append((note_id, note_data))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_export_note_group, group, output_dir, vault_path)
+                    for group in groups.values()
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for note_id, note_data in notes.items():
+                _export_note(note_id, note_data, output_dir, vault_path)
 
     except OSError as e:
         # Re-raise OSError for directory creation issues
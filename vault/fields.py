@@ -1,3 +1,4 @@
+import re
 from typing import Any
 
 
@@ -100,8 +101,12 @@ class TitleField(BaseField):
 
     Attributes:
         max_length (int): Maximum allowed length of the title
+        _PATTERN (re.Pattern): Compiled once at class creation; matches the
+            first character that is neither alphanumeric nor whitespace
     """
 
+    _PATTERN = re.compile(r"[^\w\s]|_")
+
     def __init__(self, required: bool = True, max_length: int = 100):
         """
         Initialize a new title field descriptor.
@@ -138,12 +143,12 @@ class TitleField(BaseField):
             )
 
         # Check for alphanumeric characters and spaces
-        for char in value:
-            if not (char.isalnum() or char.isspace()):
-                raise ValueError(
-                    f"{self.name} contains invalid character '{char}', "
-                    "only alphanumeric characters and spaces are allowed"
-                )
+        match = self._PATTERN.search(value)
+        if match:
+            raise ValueError(
+                f"{self.name} contains invalid character '{match.group()}', "
+                "only alphanumeric characters and spaces are allowed"
+            )
 
         return value
 
@@ -46,7 +46,8 @@ class Note:
             filename: Optional filename for content storage
 
         Raises:
-            ValueError: If the title is empty or contains only whitespace
+            ValueError: If the title is empty or contains only whitespace, or a
+                timestamp string is not in ISO 8601 format
         """
         if not title or not title.strip():
             raise ValueError("Note title cannot be empty")
@@ -55,6 +56,10 @@ class Note:
         self.title = title.strip()
         self.content = content
         self.tags = tags or []
+        if isinstance(created_at, str):
+            created_at = datetime.datetime.fromisoformat(created_at)
+        if isinstance(last_modified, str):
+            last_modified = datetime.datetime.fromisoformat(last_modified)
         self.created_at = created_at or datetime.datetime.now(datetime.timezone.utc)
         self.last_modified = last_modified or self.created_at
 